@@ -12,20 +12,20 @@ Advanced CLI downloader for AnimeWorld.ac with intelligent connection management
 
 import sys
 import click
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from rich.console import Console
+from datetime import datetime
+from typing import Optional
 from rich.table import Table
-from rich.prompt import Prompt, Confirm
-from rapidfuzz import fuzz
 
 from alchemix.core.config import Config
-from alchemix.core.speedtest_manager import SpeedTester, get_current_timestamp
-from alchemix.core.scraper import AlchemixScraper
+from alchemix.core.scraper import AlchemixScraper, Episode
 from alchemix.core.downloader import DownloadManager
 from alchemix.core.database import Database
 from alchemix.utils.axel_manager import AxelManager
 from alchemix.ui.logger import (
-    setup_logging, get_logger, console,
+    setup_logging, get_logger, get_progress, console,
     print_header, print_success, print_error, print_warning, print_info
 )
 from alchemix.ui.i18n import get_i18n
@@ -42,6 +42,28 @@ BANNER = r"""
 
 logger = get_logger(__name__)
 
+# Search results shown (and kept after fuzzy ranking)
+MAX_SEARCH_RESULTS = 20
+
+# Completed downloads are recorded in the database in batches of this size
+COMPLETED_FLUSH_SIZE = 8
+
+# Episode pages fetched at once when no speed test result is stored
+RESOLVE_WORKERS = 8
+
+# Seconds between progress display refreshes for parallel downloads
+PROGRESS_INTERVAL = 0.5
+
+
+def _written_bytes(path: Path) -> int:
+    """Bytes Axel has written to path so far; Axel fills the file sparsely, so count allocated blocks"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return 0
+    blocks = getattr(stat, "st_blocks", None)  # Not available on Windows
+    return stat.st_size if blocks is None else min(stat.st_size, blocks * 512)
+
 
 class AlchemixDownloader:
     """Main Alchemix-AWDL application class"""
@@ -63,7 +85,14 @@ class AlchemixDownloader:
 
         # Initialize database
         db_path = Path(self.config_manager.get("advanced", "database_path", ""))
-        self.db = Database(db_path)
+        self.db = Database(
+            db_path,
+            synchronous=self.config_manager.get("advanced", "sqlite_synchronous", "NORMAL")
+        )
+
+        # Completed downloads waiting to be written in one transaction
+        self._completed: list = []
+        self._completed_lock = threading.Lock()
 
         # Initialize components (lazy)
         self.axel_manager: AxelManager = None
@@ -93,6 +122,8 @@ class AlchemixDownloader:
 
         # Run speedtest
         try:
+            from alchemix.core.speedtest_manager import SpeedTester, get_current_timestamp
+
             tester = SpeedTester(self.config_manager.get("speedtest", "timeout", 30))
             download_mbps, upload_mbps, ping = tester.test_with_retry()
 
@@ -126,22 +157,32 @@ class AlchemixDownloader:
             print_warning(self.i18n.get("cli.no_results", query=query))
             return None
 
+        # Deferred: only searches load RapidFuzz's native extension
+        from rapidfuzz import fuzz, process, utils
+
+        # Normalize the query once; a query with no letters or digits has
+        # nothing to score against, so keep the site's own ranking
+        normalized_query = utils.default_process(query) if fuzzy else ""
+
         # Apply fuzzy matching if enabled
-        if fuzzy:
+        if normalized_query:
             threshold = self.config_manager.get("search", "fuzzy_threshold", 70)
-            scored_results = [
-                (result, fuzz.partial_ratio(query.lower(), result["title"].lower()))
-                for result in results
-            ]
-            # Filter by threshold
-            results = [r for r, score in scored_results if score >= threshold]
-
-            if not results:
+            # One call scores, filters, sorts and keeps the top matches in RapidFuzz's C++ core;
+            # inputs are already normalized, so no per-comparison processor runs
+            matches = process.extract(
+                normalized_query,
+                [utils.default_process(result.title) for result in results],
+                scorer=fuzz.partial_ratio,
+                score_cutoff=threshold,
+                limit=MAX_SEARCH_RESULTS
+            )
+
+            if not matches:
                 print_warning(self.i18n.get("cli.no_results", query=query))
                 return None
 
-            # Sort by score
-            results = [r for r, _ in sorted(scored_results, key=lambda x: x[1], reverse=True)]
+            # Best match first
+            results = [results[index] for _, _, index in matches]
 
         # Display results
         table = Table(title="Search Results")
@@ -150,21 +191,16 @@ class AlchemixDownloader:
         table.add_column("Type", style="yellow")
         table.add_column("ID", style="dim")
 
-        for idx, anime in enumerate(results[:20], 1):  # Limit to 20
-            anime_type = "DUB-ITA" if anime.get("is_dub") else "SUB-ITA"
-            table.add_row(str(idx), anime["title"], anime_type, anime["id"])
+        for idx, anime in enumerate(results[:MAX_SEARCH_RESULTS], 1):
+            anime_type = "DUB-ITA" if anime.is_dub else "SUB-ITA"
+            table.add_row(str(idx), anime.title, anime_type, anime.id)
 
         console.print(table)
 
         return results
 
-    def list_episodes(self, anime_url: str):
-        """List episodes for an anime"""
-        self._init_components()
-
-        anime_info = self.scraper.get_anime_info(anime_url)
-
-        # Save to database
+    def _save_anime_info(self, anime_info: dict):
+        """Save anime and all its episodes to the database"""
         self.db.add_anime(
             anime_info["id"],
             anime_info["title"],
@@ -174,16 +210,27 @@ class AlchemixDownloader:
             total_episodes=anime_info["total_episodes"]
         )
 
-        # Add all episodes to database
-        for season_episodes in anime_info["seasons"].values():
-            for ep in season_episodes:
-                self.db.add_episode(
-                    ep["id"],
-                    anime_info["id"],
-                    ep["number"],
-                    title=ep["title"],
-                    url=ep["url"]
-                )
+        # Write all episodes in a single transaction
+        self.db.add_episodes([
+            Database.episode_row(
+                ep.id,
+                anime_info["id"],
+                ep.number,
+                title=ep.title,
+                url=ep.url
+            )
+            for season_episodes in anime_info["seasons"].values()
+            for ep in season_episodes
+        ])
+
+    def list_episodes(self, anime_url: str, refresh: bool = False):
+        """List episodes for an anime"""
+        self._init_components()
+
+        anime_info = self.scraper.get_anime_info(anime_url, refresh=refresh)
+
+        # Save to database
+        self._save_anime_info(anime_info)
 
         # Display info
         console.print(f"\n[bold cyan]{anime_info['title']}[/bold cyan]")
@@ -193,6 +240,11 @@ class AlchemixDownloader:
         if anime_info["description"]:
             console.print(f"[dim]{anime_info['description'][:200]}...[/dim]\n")
 
+        # One query for the download state of every episode
+        downloaded = self.db.filter_downloaded([
+            ep.id for episodes in anime_info["seasons"].values() for ep in episodes
+        ])
+
         # Display episodes by season
         for season, episodes in anime_info["seasons"].items():
             table = Table(title=f"Season {season}")
@@ -202,10 +254,9 @@ class AlchemixDownloader:
 
             for ep in episodes:
                 # Check if downloaded
-                is_downloaded = self.db.is_downloaded(ep["id"])
-                status = "✓" if is_downloaded else ""
+                status = "✓" if ep.id in downloaded else ""
 
-                table.add_row(str(ep["number"]), ep["title"], status)
+                table.add_row(str(ep.number), ep.title, status)
 
             console.print(table)
 
@@ -215,34 +266,17 @@ class AlchemixDownloader:
         self,
         anime_url: str,
         episodes: str = "all",
-        connections: int = None
+        connections: int = None,
+        refresh: bool = False
     ):
         """Download episodes"""
         self._init_components()
 
         # Get anime info
-        anime_info = self.scraper.get_anime_info(anime_url)
-
-        # Save anime to database
-        self.db.add_anime(
-            anime_info["id"],
-            anime_info["title"],
-            url=anime_info["url"],
-            description=anime_info["description"],
-            genres=anime_info["genres"],
-            total_episodes=anime_info["total_episodes"]
-        )
+        anime_info = self.scraper.get_anime_info(anime_url, refresh=refresh)
 
-        # Add all episodes to database
-        for season_episodes in anime_info["seasons"].values():
-            for ep in season_episodes:
-                self.db.add_episode(
-                    ep["id"],
-                    anime_info["id"],
-                    ep["number"],
-                    title=ep["title"],
-                    url=ep["url"]
-                )
+        # Save anime and episodes to database
+        self._save_anime_info(anime_info)
 
         # Parse episode selection
         selected_episodes = self._parse_episode_selection(
@@ -264,56 +298,178 @@ class AlchemixDownloader:
         output_dir = Path(self.config_manager.get("download", "output_dir", ""))
         anime_dir = output_dir / anime_info["title"]
 
-        for episode in selected_episodes:
-            try:
-                # Get video URL
-                video_url = self.scraper.get_video_url(episode["url"])
-
-                # Format filename
-                filename = self.downloader.format_filename(
-                    anime_title=anime_info["title"],
-                    episode_number=episode["number"],
-                    season=1,  # TODO: detect from seasons
-                    pattern=self.config_manager.get("download", "naming_pattern", "original")
-                )
-
-                output_path = anime_dir / filename
-
-                # Check if already downloaded
-                if self.db.is_downloaded(episode["id"]):
-                    print_info(f"Skipping {filename} (already downloaded)")
-                    continue
+        naming_pattern = self.config_manager.get("download", "naming_pattern", "original")
 
-                # Download with retry
-                success = self.downloader.download_with_retry(
-                    url=video_url,
-                    output_path=output_path,
-                    connections=connections,
-                    max_attempts=self.config_manager.get("download", "retry_attempts", 3),
-                    backoff=self.config_manager.get("download", "retry_backoff", True)
-                )
-
-                if success:
-                    # Mark as downloaded
-                    file_size = output_path.stat().st_size if output_path.exists() else 0
-                    self.db.mark_downloaded(episode["id"], str(output_path), file_size)
-                else:
-                    console.print(f"[red]✗[/red] Failed: {filename}")
-
-            except KeyboardInterrupt:
-                print_warning("\nDownload interrupted by user")
-                break
-
-            except Exception as e:
-                print_error(f"Error downloading {episode['title']}: {e}")
+        # Skip already downloaded episodes before any video URL is resolved
+        downloaded = self.db.filter_downloaded([episode.id for episode in selected_episodes])
+        pending = []
+        for episode in selected_episodes:
+            # Format filename
+            filename = self.downloader.format_filename(
+                anime_title=anime_info["title"],
+                episode_number=episode.number,
+                season=1,  # TODO: detect from seasons
+                pattern=naming_pattern
+            )
+
+            if episode.id in downloaded:
+                print_info(f"Skipping {filename} (already downloaded)")
                 continue
 
+            pending.append((episode, anime_dir / filename))
+
+        # Up to parallel_episodes Axel processes run at once, sharing the connection budget
+        parallel = max(1, int(self.config_manager.get("download", "parallel_episodes", 1)))
+        job_connections = max(1, connections // parallel)
+        slots = threading.BoundedSemaphore(parallel)
+        self.downloader.cancel_event.clear()
+
+        # Parallel Axel processes would interleave their output on the terminal,
+        # so they run silenced and report through one progress display instead
+        progress = get_progress() if parallel > 1 else None
+        stop_polling = threading.Event()
+
+        # Video URLs are resolved one window of parallel episodes at a time, the
+        # next window in the background while the current one waits for slots,
+        # so scraping hides behind the downloads and no URL is resolved long before use
+        windows = [pending[start:start + parallel] for start in range(0, len(pending), parallel)]
+        resolve_workers = self._resolve_workers()
+
+        def resolve(window):
+            return self.scraper.get_video_urls([episode.url for episode, _ in window], max_workers=resolve_workers)
+
+        try:
+            with ThreadPoolExecutor(max_workers=1) as resolver, ThreadPoolExecutor(max_workers=parallel) as workers:
+                next_urls = resolver.submit(resolve, windows[0]) if windows else None
+                jobs = []
+
+                try:
+                    for index, window in enumerate(windows):
+                        video_urls = next_urls.result()
+                        next_urls = resolver.submit(resolve, windows[index + 1]) if index + 1 < len(windows) else None
+
+                        if index == 0:
+                            # Refuse the batch rather than running out of disk part-way,
+                            # estimating its size from the first window's files
+                            fits, sizes = self.downloader.check_batch_space(anime_dir, video_urls, len(pending))
+                            if not fits:
+                                return
+                        else:
+                            sizes = [None] * len(window)
+
+                            if progress is not None:
+                                progress.start()
+                                threading.Thread(target=self._poll_progress, args=(progress, stop_polling), daemon=True).start()
+
+                        for (episode, output_path), video_url, size in zip(window, video_urls, sizes):
+                            # Wait for a free download slot
+                            slots.acquire()
+                            job = workers.submit(
+                                self._download_episode, episode, output_path, video_url, job_connections, progress, size
+                            )
+                            job.add_done_callback(lambda _: slots.release())
+                            jobs.append(job)
+
+                    for job in jobs:
+                        job.result()
+
+                except KeyboardInterrupt:
+                    if next_urls is not None:
+                        next_urls.cancel()
+                    for job in jobs:
+                        job.cancel()
+                    self.downloader.cancel()
+                    print_warning("\nDownload interrupted by user")
+        finally:
+            stop_polling.set()
+            if progress is not None:
+                progress.stop()
+            # Write whatever completed, also when interrupted
+            self._flush_completed()
+
+    @staticmethod
+    def _poll_progress(progress, stop: threading.Event):
+        """Update every running download's task from the bytes written so far"""
+        while not stop.wait(PROGRESS_INTERVAL):
+            for task in progress.tasks:
+                try:
+                    progress.update(task.id, completed=_written_bytes(task.fields["path"]))
+                except KeyError:
+                    pass  # Task removed since progress.tasks was read
+
+    def _resolve_workers(self) -> int:
+        """Episode pages fetched at once, scaled with the speed tier of the last speed test"""
+        speed = self.config_manager.get("speedtest", "last_speed_mbps", 0)
+        if not speed:
+            return RESOLVE_WORKERS
+
+        from alchemix.core.speedtest_manager import SpeedTester
+
+        return SpeedTester().get_speed_tier_info(speed)["connections"]
+
+    def _flush_completed(self, min_rows: int = 1):
+        """Write recorded downloads to the database once at least min_rows are pending"""
+        with self._completed_lock:
+            if len(self._completed) < min_rows:
+                return
+            rows, self._completed = self._completed, []
+        self.db.mark_downloaded_batch(rows)
+
+    def _download_episode(
+        self,
+        episode: Episode,
+        output_path: Path,
+        video_url: Optional[str],
+        connections: int,
+        progress=None,
+        size: Optional[int] = None
+    ):
+        """Download one episode from its resolved video URL, then record it; size, when known, is its progress total"""
+        if video_url is None:
+            # get_video_urls already logged why
+            print_error(f"Error downloading {episode.title}: could not extract video URL")
+            return
+
+        task = None
+        try:
+            if progress is not None:
+                task = progress.add_task(output_path.name, total=size, path=output_path)
+
+            # Download with retry
+            file_size = self.downloader.download_with_retry(
+                url=video_url,
+                output_path=output_path,
+                connections=connections,
+                max_attempts=self.config_manager.get("download", "retry_attempts", 3),
+                backoff=self.config_manager.get("download", "retry_backoff", True),
+                show_output=progress is None
+            )
+
+            if file_size is not None:
+                # Mark as downloaded, written in batches by _flush_completed
+                with self._completed_lock:
+                    self._completed.append((episode.id, str(output_path), file_size, datetime.now().isoformat()))
+                self._flush_completed(COMPLETED_FLUSH_SIZE)
+            elif not self.downloader.cancel_event.is_set():
+                console.print(f"[red]✗[/red] Failed: {output_path.name}")
+
+        except Exception as e:
+            print_error(f"Error downloading {episode.title}: {e}")
+
+        finally:
+            if task is not None:
+                progress.remove_task(task)
+
     def _parse_episode_selection(self, selection: str, episodes: list) -> list:
         """Parse episode selection (all, range, list)"""
         if selection.lower() == "all":
             return episodes
 
-        selected = []
+        # Collect the wanted numbers first, then pick episodes in one pass.
+        # Ranges are clipped to the numbers that exist, so "1-999999" stays cheap
+        wanted = set()
+        numbers = [ep.number for ep in episodes]
+        lowest, highest = (min(numbers), max(numbers)) if numbers else (0, -1)
 
         # Support both comma-separated and range
         parts = selection.split(",")
@@ -325,11 +481,7 @@ class AlchemixDownloader:
             if "-" in part:
                 try:
                     start, end = part.split("-")
-                    start, end = int(start), int(end)
-
-                    for ep in episodes:
-                        if start <= ep["number"] <= end:
-                            selected.append(ep)
+                    wanted.update(range(max(int(start), lowest), min(int(end), highest) + 1))
 
                 except ValueError:
                     print_warning(f"Invalid range: {part}")
@@ -338,17 +490,17 @@ class AlchemixDownloader:
             # Single episode
             else:
                 try:
-                    ep_num = int(part)
-                    for ep in episodes:
-                        if ep["number"] == ep_num:
-                            selected.append(ep)
-                            break
+                    wanted.add(int(part))
 
                 except ValueError:
                     print_warning(f"Invalid episode number: {part}")
                     continue
 
-        return selected
+        # Episode order, each episode at most once
+        return [
+            ep for ep in episodes
+            if ep.number in wanted
+        ]
 
     def show_config(self):
         """Show current configuration"""
@@ -357,10 +509,13 @@ class AlchemixDownloader:
         table.add_column("Key", style="yellow")
         table.add_column("Value", style="green")
 
-        for section, values in self.config.items():
-            if isinstance(values, dict):
-                for key, value in values.items():
-                    table.add_row(section, key, str(value))
+        rows = [
+            (section, key, str(value))
+            for section, values in self.config.items() if isinstance(values, dict)
+            for key, value in values.items()
+        ]
+        for row in rows:
+            table.add_row(*row)
 
         console.print(table)
         console.print(f"\nConfig file: [cyan]{self.config_manager.config_file}[/cyan]")
@@ -399,6 +554,8 @@ def cli(ctx, retest, interactive, verbose, quiet):
 
     # Retest if requested
     if retest:
+        from alchemix.core.speedtest_manager import SpeedTester, get_current_timestamp
+
         tester = SpeedTester()
         download_mbps, _, _ = tester.run_test()
         connections = app.config_manager.get_connections_for_speed(download_mbps)
@@ -426,22 +583,24 @@ def search(ctx, query):
 
 @cli.command()
 @click.argument("anime_url")
+@click.option("--refresh", is_flag=True, help="Fetch the anime page again instead of using a cached copy")
 @click.pass_context
-def list(ctx, anime_url):
+def list(ctx, anime_url, refresh):
     """List episodes for an anime"""
     app = ctx.obj["app"]
-    app.list_episodes(anime_url)
+    app.list_episodes(anime_url, refresh=refresh)
 
 
 @cli.command()
 @click.argument("anime_url")
 @click.option("--episodes", "-e", default="all", help="Episodes to download (all, 1-10, 1,3,5)")
 @click.option("--connections", "-c", type=int, help="Override connection count")
+@click.option("--refresh", is_flag=True, help="Fetch the anime page again instead of using a cached copy")
 @click.pass_context
-def download(ctx, anime_url, episodes, connections):
+def download(ctx, anime_url, episodes, connections, refresh):
     """Download anime episodes"""
     app = ctx.obj["app"]
-    app.download_episodes(anime_url, episodes, connections)
+    app.download_episodes(anime_url, episodes, connections, refresh=refresh)
 
 
 @cli.command()
@@ -4,7 +4,9 @@ Handles TOML config loading, saving, and defaults
 """
 
 import os
-import toml
+import copy
+import bisect
+import functools
 from pathlib import Path
 from typing import Dict, Any, Optional
 from platformdirs import user_config_dir
@@ -59,10 +61,15 @@ DEFAULT_CONFIG = {
     "advanced": {
         "check_updates": True,
         "cache_expire_days": 7,
-        "database_path": ""  # Auto-set to config dir
+        "database_path": "",  # Auto-set to config dir
+        "sqlite_synchronous": "NORMAL"  # NORMAL or FULL (e.g. on network filesystems)
     }
 }
 
+# Private copy of the defaults; every load/merge deep-copies this so that
+# Config instances never share (and mutate) the same section dicts
+_DEFAULT_TEMPLATE = copy.deepcopy(DEFAULT_CONFIG)
+
 # Connection tier mapping based on speed (Mbps)
 CONNECTION_TIERS = [
     (0, 10, 1),
@@ -77,6 +84,10 @@ CONNECTION_TIERS = [
     (1500, float('inf'), 256)
 ]
 
+# Tier lower bounds and connection counts, for binary search in get_connections_for_speed
+_TIER_STARTS = [min_speed for min_speed, _, _ in CONNECTION_TIERS]
+_TIER_CONNECTIONS = [connections for _, _, connections in CONNECTION_TIERS]
+
 
 class Config:
     """Configuration manager for AnimeWorld Downloader"""
@@ -85,6 +96,7 @@ class Config:
         self.config_dir = Path(user_config_dir("animeworld-dl"))
         self.config_file = self.config_dir / "config.toml"
         self.config: Dict[str, Any] = {}
+        self._loaded_mtime: Optional[float] = None
         self._ensure_config_dir()
 
     def _ensure_config_dir(self):
@@ -93,16 +105,34 @@ class Config:
 
     def load(self) -> Dict[str, Any]:
         """Load configuration from file or create default"""
-        if self.config_file.exists():
+        try:
+            mtime = self.config_file.stat().st_mtime
+        except FileNotFoundError:
+            mtime = None
+
+        if mtime is not None:
+            # File unchanged since the last load: keep the merged config
+            if self.config and mtime == self._loaded_mtime:
+                return self.config
+
             try:
-                self.config = toml.load(self.config_file)
+                # Deferred: only needed when a config file exists. tomllib is
+                # read-only (the toml package is still used by save()); before
+                # Python 3.11 the same parser comes from its tomli backport
+                try:
+                    import tomllib
+                except ModuleNotFoundError:
+                    import tomli as tomllib
+
+                self.config = tomllib.loads(self.config_file.read_text(encoding="utf-8"))
                 # Merge with defaults to add any new keys
                 self.config = self._merge_with_defaults(self.config)
+                self._loaded_mtime = mtime
             except Exception as e:
                 print(f"Error loading config: {e}")
-                self.config = DEFAULT_CONFIG.copy()
+                self.config = copy.deepcopy(_DEFAULT_TEMPLATE)
         else:
-            self.config = DEFAULT_CONFIG.copy()
+            self.config = copy.deepcopy(_DEFAULT_TEMPLATE)
             # Set auto-paths
             self.config["advanced"]["database_path"] = str(self.config_dir / "animeworld.db")
 
@@ -110,7 +140,7 @@ class Config:
 
     def _merge_with_defaults(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Merge user config with defaults to ensure all keys exist"""
-        merged = DEFAULT_CONFIG.copy()
+        merged = copy.deepcopy(_DEFAULT_TEMPLATE)
         for section, values in config.items():
             if section in merged and isinstance(values, dict):
                 merged[section].update(values)
@@ -121,6 +151,8 @@ class Config:
     def save(self):
         """Save current configuration to file"""
         try:
+            import toml  # Deferred: only needed when saving
+
             with open(self.config_file, 'w') as f:
                 toml.dump(self.config, f)
         except Exception as e:
@@ -138,23 +170,33 @@ class Config:
 
     def get_connections_for_speed(self, speed_mbps: float) -> int:
         """Calculate optimal connections based on speed"""
-        for min_speed, max_speed, connections in CONNECTION_TIERS:
-            if min_speed <= speed_mbps < max_speed:
-                return connections
+        index = bisect.bisect_right(_TIER_STARTS, speed_mbps) - 1
+        if index >= 0:
+            return _TIER_CONNECTIONS[index]
         return 4  # Default fallback
 
     def exists(self) -> bool:
         """Check if config file exists"""
         return self.config_file.exists()
 
-    def get_logs_dir(self) -> Path:
-        """Get logs directory path"""
+    @functools.cached_property
+    def logs_dir(self) -> Path:
+        """Logs directory path, created on first access"""
         logs_dir = self.config_dir / "logs"
         logs_dir.mkdir(exist_ok=True)
         return logs_dir
 
-    def get_cache_dir(self) -> Path:
-        """Get cache directory path"""
+    @functools.cached_property
+    def cache_dir(self) -> Path:
+        """Cache directory path, created on first access"""
         cache_dir = self.config_dir / "cache"
         cache_dir.mkdir(exist_ok=True)
         return cache_dir
+
+    def get_logs_dir(self) -> Path:
+        """Get logs directory path"""
+        return self.logs_dir
+
+    def get_cache_dir(self) -> Path:
+        """Get cache directory path"""
+        return self.cache_dir
@@ -3,198 +3,403 @@ AnimeWorld Downloader - Database Module
 SQLite database for tracking downloads and cache
 """
 
+import os
+import queue
 import sqlite3
+import time
+import functools
+from operator import itemgetter
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional, Set
 from ..ui.logger import get_logger
 
 logger = get_logger(__name__)
 
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+# Every anime and episode scraped from an absolute URL used to get the host's
+# "ac" as its ID, and episodes later got their anime's ID; metadata records
+# once those rows have been re-keyed
+LEGACY_ID = "ac"
+ID_SCHEME_KEY = "id_scheme"
+ID_SCHEME = "episode-segment"
+
+SCHEMA_SQL = """
+BEGIN;
+
+-- Anime table
+CREATE TABLE IF NOT EXISTS anime (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    url TEXT,
+    description TEXT,
+    genres TEXT,
+    total_episodes INTEGER,
+    is_dub BOOLEAN,
+    added_date TEXT,
+    last_updated TEXT
+);
+
+-- Episodes table
+CREATE TABLE IF NOT EXISTS episodes (
+    id TEXT PRIMARY KEY,
+    anime_id TEXT NOT NULL,
+    episode_number INTEGER NOT NULL,
+    season INTEGER DEFAULT 1,
+    title TEXT,
+    url TEXT,
+    video_url TEXT,
+    file_path TEXT,
+    file_size INTEGER,
+    downloaded BOOLEAN DEFAULT 0,
+    download_date TEXT,
+    FOREIGN KEY (anime_id) REFERENCES anime(id)
+);
+
+-- Download queue table
+CREATE TABLE IF NOT EXISTS download_queue (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    anime_id TEXT NOT NULL,
+    episode_id TEXT NOT NULL,
+    status TEXT DEFAULT 'pending',
+    priority INTEGER DEFAULT 0,
+    added_date TEXT,
+    started_date TEXT,
+    completed_date TEXT,
+    error_message TEXT,
+    FOREIGN KEY (anime_id) REFERENCES anime(id),
+    FOREIGN KEY (episode_id) REFERENCES episodes(id)
+);
+
+-- Cache table for scraped data
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value TEXT,
+    expires_at TEXT
+);
+
+-- Settings/metadata table
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+-- Indexes for performance
+-- Serves get_episodes' WHERE anime_id = ? ORDER BY season, episode_number
+-- without a sort step; supersedes the old single-column anime_id index
+CREATE INDEX IF NOT EXISTS idx_episodes_anime_season_ep
+ON episodes(anime_id, season, episode_number);
+
+DROP INDEX IF EXISTS idx_episodes_anime_id;
+
+CREATE INDEX IF NOT EXISTS idx_episodes_downloaded ON episodes(downloaded);
+CREATE INDEX IF NOT EXISTS idx_episodes_dl_size ON episodes(downloaded, file_size);
+CREATE INDEX IF NOT EXISTS idx_queue_status ON download_queue(status);
+
+COMMIT;
+"""
+
+# Full-text index over anime titles, kept in sync with the anime table by triggers
+FTS_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS anime_fts USING fts5(
+    title,
+    content='anime',
+    content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS anime_fts_insert AFTER INSERT ON anime BEGIN
+    INSERT INTO anime_fts(rowid, title) VALUES (new.rowid, new.title);
+END;
+
+CREATE TRIGGER IF NOT EXISTS anime_fts_delete AFTER DELETE ON anime BEGIN
+    INSERT INTO anime_fts(anime_fts, rowid, title) VALUES ('delete', old.rowid, old.title);
+END;
+
+CREATE TRIGGER IF NOT EXISTS anime_fts_update AFTER UPDATE ON anime BEGIN
+    INSERT INTO anime_fts(anime_fts, rowid, title) VALUES ('delete', old.rowid, old.title);
+    INSERT INTO anime_fts(rowid, title) VALUES (new.rowid, new.title);
+END;
+"""
+
+# Hot-path statements, kept as constants so every call hits the
+# connection's prepared statement cache with the same SQL text
+# Re-scraping an episode updates its metadata in place and keeps its download state
+INSERT_EPISODE_SQL = """
+    INSERT INTO episodes
+    (id, anime_id, episode_number, season, title, url, video_url,
+     file_path, file_size, downloaded, download_date)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        anime_id = excluded.anime_id,
+        episode_number = excluded.episode_number,
+        season = excluded.season,
+        title = excluded.title,
+        url = excluded.url,
+        video_url = COALESCE(NULLIF(excluded.video_url, ''), episodes.video_url)
+"""
+
+MARK_DOWNLOADED_SQL = """
+    UPDATE episodes
+    SET downloaded = 1, file_path = ?, file_size = ?, download_date = ?
+    WHERE id = ?
+"""
+
+IS_DOWNLOADED_SQL = "SELECT downloaded FROM episodes WHERE id = ?"
+
+# Most IDs bound in a single "IN (...)" query; older SQLite builds allow 999 parameters
+IN_CHUNK_SIZE = 500
+
+# Optional episode fields in column order, with the values stored when omitted
+_EP_DEFAULTS = {
+    "season": 1,
+    "title": "",
+    "url": "",
+    "video_url": "",
+    "file_path": "",
+    "file_size": 0,
+    "downloaded": False,
+    "download_date": ""
+}
+_EP_GETTER = itemgetter(*_EP_DEFAULTS)
+
+
+@functools.lru_cache(maxsize=1)
+def _now_iso(bucket: int) -> str:
+    """ISO timestamp shared by every call within the same one-second bucket"""
+    return datetime.now().isoformat()
+
 
 class Database:
     """SQLite database manager"""
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, synchronous: str = "NORMAL", pool_size: int = 4):
         self.db_path = db_path
-        self.conn: Optional[sqlite3.Connection] = None
+        self.synchronous = synchronous.upper() if synchronous.upper() in SYNCHRONOUS_MODES else "NORMAL"
+        self.pool_size = max(1, pool_size)
+        self._pool: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=self.pool_size)
+        self._conns: List[sqlite3.Connection] = []
+        self._fts = False
         self._init_db()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection configured for shared use across threads"""
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False, cached_statements=256)
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+
+        # WAL lets readers run alongside the writer and, with synchronous=NORMAL,
+        # commits no longer fsync the main database file
+        conn.executescript(f"""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous={self.synchronous};
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-20000;
+        """)
+        if os.name != "nt":
+            conn.execute("PRAGMA mmap_size=268435456")
+
+        return conn
+
+    def _init_pool(self):
+        """Open pool_size connections and make them available to _get()"""
+        for _ in range(self.pool_size):
+            conn = self._connect()
+            self._conns.append(conn)
+            self._pool.put(conn)
+
+    @contextmanager
+    def _get(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection from the pool for the duration of the block"""
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
     def _init_db(self):
         """Initialize database and create tables"""
         try:
-            self.conn = sqlite3.connect(str(self.db_path))
-            self.conn.row_factory = sqlite3.Row  # Enable column access by name
-
-            cursor = self.conn.cursor()
-
-            # Anime table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS anime (
-                    id TEXT PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    url TEXT,
-                    description TEXT,
-                    genres TEXT,
-                    total_episodes INTEGER,
-                    is_dub BOOLEAN,
-                    added_date TEXT,
-                    last_updated TEXT
-                )
-            """)
-
-            # Episodes table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS episodes (
-                    id TEXT PRIMARY KEY,
-                    anime_id TEXT NOT NULL,
-                    episode_number INTEGER NOT NULL,
-                    season INTEGER DEFAULT 1,
-                    title TEXT,
-                    url TEXT,
-                    video_url TEXT,
-                    file_path TEXT,
-                    file_size INTEGER,
-                    downloaded BOOLEAN DEFAULT 0,
-                    download_date TEXT,
-                    FOREIGN KEY (anime_id) REFERENCES anime(id)
-                )
-            """)
-
-            # Download queue table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS download_queue (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    anime_id TEXT NOT NULL,
-                    episode_id TEXT NOT NULL,
-                    status TEXT DEFAULT 'pending',
-                    priority INTEGER DEFAULT 0,
-                    added_date TEXT,
-                    started_date TEXT,
-                    completed_date TEXT,
-                    error_message TEXT,
-                    FOREIGN KEY (anime_id) REFERENCES anime(id),
-                    FOREIGN KEY (episode_id) REFERENCES episodes(id)
-                )
-            """)
-
-            # Cache table for scraped data
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS cache (
-                    key TEXT PRIMARY KEY,
-                    value TEXT,
-                    expires_at TEXT
-                )
-            """)
-
-            # Settings/metadata table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS metadata (
-                    key TEXT PRIMARY KEY,
-                    value TEXT
-                )
-            """)
-
-            # Indexes for performance
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_episodes_anime_id
-                ON episodes(anime_id)
-            """)
-
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_episodes_downloaded
-                ON episodes(downloaded)
-            """)
-
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_queue_status
-                ON download_queue(status)
-            """)
-
-            self.conn.commit()
+            self._init_pool()
+
+            with self._get() as conn:
+                # One script, one transaction: a single journal sync for the whole schema
+                conn.executescript(SCHEMA_SQL)
+
+                # Full-text index over anime titles
+                self._fts = self._init_fts(conn)
+
+                self._migrate_ids(conn)
+
             logger.debug("database.initialized", path=str(self.db_path))
 
         except Exception as e:
             logger.error("database.init_failed", error=str(e))
             raise DatabaseError(f"Failed to initialize database: {e}")
 
+    def _init_fts(self, conn: sqlite3.Connection) -> bool:
+        """
+        Create the FTS5 title index and the triggers keeping it in sync
+
+        Returns:
+            bool: False if this SQLite build lacks FTS5
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'anime_fts'"
+        ).fetchone() is not None
+
+        # Index rows that existed before the FTS table was created
+        rebuild = "" if exists else "INSERT INTO anime_fts(anime_fts) VALUES ('rebuild');"
+
+        try:
+            conn.executescript(f"BEGIN;\n{FTS_SQL}\n{rebuild}\nCOMMIT;")
+            return True
+
+        except sqlite3.OperationalError as e:
+            if conn.in_transaction:
+                conn.rollback()
+            logger.debug("database.fts_unavailable", error=str(e))
+            return False
+
+    def _migrate_ids(self, conn: sqlite3.Connection):
+        """
+        Re-key rows stored under an outdated ID with the ID taken from their URL
+
+        Runs once per database, so rows recorded before the ID fixes keep
+        matching the IDs the scraper now produces. Every episode of an anime
+        used to share one row, so the download recorded on such a row cannot
+        be told apart by episode and is cleared.
+        """
+        done = conn.execute(
+            "SELECT 1 FROM metadata WHERE key = ? AND value = ?", (ID_SCHEME_KEY, ID_SCHEME)
+        ).fetchone()
+        if done:
+            return
+
+        # Deferred: only needed the one time the migration runs
+        from .scraper import extract_id_from_url, extract_episode_id_from_url
+        conn.create_function("url_id", 1, extract_id_from_url, deterministic=True)
+        conn.create_function("episode_url_id", 1, extract_episode_id_from_url, deterministic=True)
+
+        with conn:
+            # OR IGNORE: a row already stored under the new ID wins
+            conn.execute(
+                "UPDATE OR IGNORE anime SET id = url_id(url) WHERE id = ? AND url_id(url) != ''",
+                (LEGACY_ID,)
+            )
+            # An episode URL starts with its anime's page URL, so yields the anime ID
+            conn.execute(
+                "UPDATE episodes SET anime_id = url_id(url) WHERE anime_id = ? AND url_id(url) != ''",
+                (LEGACY_ID,)
+            )
+            # Shared rows hold the last upserted episode's URL: move each to that
+            # episode's ID, and drop the ones whose episode already has its own row
+            conn.execute(
+                "UPDATE OR IGNORE episodes SET id = episode_url_id(url),"
+                " downloaded = 0, file_path = NULL, file_size = NULL, download_date = NULL"
+                " WHERE episode_url_id(url) != '' AND id != episode_url_id(url)"
+            )
+            conn.execute(
+                "DELETE FROM episodes WHERE episode_url_id(url) != '' AND id != episode_url_id(url)"
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)", (ID_SCHEME_KEY, ID_SCHEME)
+            )
+
+        logger.debug("database.ids_migrated")
+
     def add_anime(self, anime_id: str, title: str, **kwargs) -> bool:
         """Add or update anime in database"""
         try:
-            cursor = self.conn.cursor()
-
-            now = datetime.now().isoformat()
-
-            cursor.execute("""
-                INSERT OR REPLACE INTO anime
-                (id, title, url, description, genres, total_episodes, is_dub, added_date, last_updated)
-                VALUES (?, ?, ?, ?, ?, ?, ?,
-                    COALESCE((SELECT added_date FROM anime WHERE id = ?), ?),
-                    ?)
-            """, (
-                anime_id,
-                title,
-                kwargs.get("url", ""),
-                kwargs.get("description", ""),
-                ",".join(kwargs.get("genres", [])),
-                kwargs.get("total_episodes", 0),
-                kwargs.get("is_dub", False),
-                anime_id,  # For COALESCE check
-                now,  # added_date if new
-                now   # last_updated always now
-            ))
-
-            self.conn.commit()
+            # added_date/last_updated are coarse, a timestamp cached per second is enough
+            now = _now_iso(int(time.monotonic()))
+
+            with self._get() as conn:
+                with conn:
+                    # Update in place on conflict so added_date is kept
+                    conn.execute("""
+                        INSERT INTO anime
+                        (id, title, url, description, genres, total_episodes, is_dub, added_date, last_updated)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(id) DO UPDATE SET
+                            title = excluded.title,
+                            url = excluded.url,
+                            description = excluded.description,
+                            genres = excluded.genres,
+                            total_episodes = excluded.total_episodes,
+                            is_dub = excluded.is_dub,
+                            last_updated = excluded.last_updated
+                    """, (
+                        anime_id,
+                        title,
+                        kwargs.get("url", ""),
+                        kwargs.get("description", ""),
+                        ",".join(kwargs.get("genres", [])),
+                        kwargs.get("total_episodes", 0),
+                        kwargs.get("is_dub", False),
+                        now,  # added_date, only used for new rows
+                        now   # last_updated always now
+                    ))
+
             return True
 
         except Exception as e:
             logger.error("database.add_anime_failed", error=str(e))
             return False
 
-    def add_episode(self, episode_id: str, anime_id: str, episode_number: int, **kwargs) -> bool:
-        """Add or update episode in database"""
+    @staticmethod
+    def episode_row(episode_id: str, anime_id: str, episode_number: int, **kwargs) -> tuple:
+        """Build an episodes row tuple in the column order used by add_episodes"""
+        return (episode_id, anime_id, episode_number) + _EP_GETTER({**_EP_DEFAULTS, **kwargs})
+
+    def add_episodes(self, rows: List[tuple]) -> bool:
+        """
+        Add or update many episodes in a single transaction
+
+        Args:
+            rows: Row tuples as built by episode_row()
+
+        Returns:
+            bool: True if all rows were written
+        """
         try:
-            cursor = self.conn.cursor()
-
-            cursor.execute("""
-                INSERT OR REPLACE INTO episodes
-                (id, anime_id, episode_number, season, title, url, video_url,
-                 file_path, file_size, downloaded, download_date)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                episode_id,
-                anime_id,
-                episode_number,
-                kwargs.get("season", 1),
-                kwargs.get("title", ""),
-                kwargs.get("url", ""),
-                kwargs.get("video_url", ""),
-                kwargs.get("file_path", ""),
-                kwargs.get("file_size", 0),
-                kwargs.get("downloaded", False),
-                kwargs.get("download_date", "")
-            ))
-
-            self.conn.commit()
+            with self._get() as conn:
+                with conn:
+                    conn.executemany(INSERT_EPISODE_SQL, rows)
+
             return True
 
         except Exception as e:
             logger.error("database.add_episode_failed", error=str(e))
             return False
 
+    def add_episode(self, episode_id: str, anime_id: str, episode_number: int, **kwargs) -> bool:
+        """Add or update episode in database"""
+        return self.add_episodes([self.episode_row(episode_id, anime_id, episode_number, **kwargs)])
+
     def mark_downloaded(self, episode_id: str, file_path: str, file_size: int = 0) -> bool:
         """Mark episode as downloaded"""
-        try:
-            cursor = self.conn.cursor()
-            now = datetime.now().isoformat()
+        return self.mark_downloaded_batch([(episode_id, file_path, file_size, datetime.now().isoformat())])
+
+    def mark_downloaded_batch(self, rows: List[tuple]) -> bool:
+        """
+        Mark many episodes as downloaded in a single transaction
 
-            cursor.execute("""
-                UPDATE episodes
-                SET downloaded = 1, file_path = ?, file_size = ?, download_date = ?
-                WHERE id = ?
-            """, (file_path, file_size, now, episode_id))
+        Args:
+            rows: (episode_id, file_path, file_size, download_date) tuples
+
+        Returns:
+            bool: True if all rows were written
+        """
+        try:
+            with self._get() as conn:
+                with conn:
+                    conn.executemany(MARK_DOWNLOADED_SQL, [
+                        (file_path, file_size, download_date, episode_id)
+                        for episode_id, file_path, file_size, download_date in rows
+                    ])
 
-            self.conn.commit()
             return True
 
         except Exception as e:
@@ -204,9 +409,10 @@ class Database:
     def get_anime(self, anime_id: str) -> Optional[Dict]:
         """Get anime by ID"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT * FROM anime WHERE id = ?", (anime_id,))
-            row = cursor.fetchone()
+            with self._get() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT * FROM anime WHERE id = ?", (anime_id,))
+                row = cursor.fetchone()
 
             if row:
                 return dict(row)
@@ -219,17 +425,20 @@ class Database:
     def get_episodes(self, anime_id: str, downloaded_only: bool = False) -> List[Dict]:
         """Get episodes for anime"""
         try:
-            cursor = self.conn.cursor()
-
             query = "SELECT * FROM episodes WHERE anime_id = ?"
             if downloaded_only:
                 query += " AND downloaded = 1"
             query += " ORDER BY season, episode_number"
 
-            cursor.execute(query, (anime_id,))
-            rows = cursor.fetchall()
+            with self._get() as conn:
+                # Plain tuples: build each dict from one shared column list
+                cursor = conn.cursor()
+                cursor.row_factory = None
+                cursor.execute(query, (anime_id,))
+                rows = cursor.fetchall()
+                columns = [column[0] for column in cursor.description]
 
-            return [dict(row) for row in rows]
+            return [dict(zip(columns, row)) for row in rows]
 
         except Exception as e:
             logger.error("database.get_episodes_failed", error=str(e))
@@ -238,29 +447,67 @@ class Database:
     def is_downloaded(self, episode_id: str) -> bool:
         """Check if episode is already downloaded"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(
-                "SELECT downloaded FROM episodes WHERE id = ?",
-                (episode_id,)
-            )
-            row = cursor.fetchone()
+            with self._get() as conn:
+                row = conn.execute(IS_DOWNLOADED_SQL, (episode_id,)).fetchone()
+
             return bool(row and row[0])
 
         except Exception as e:
             logger.error("database.is_downloaded_check_failed", error=str(e))
             return False
 
+    def filter_downloaded(self, episode_ids: List[str]) -> Set[str]:
+        """
+        Find which of the given episodes are already downloaded
+
+        Args:
+            episode_ids: Episode IDs to check
+
+        Returns:
+            Set[str]: The downloaded subset of episode_ids
+        """
+        downloaded = set()
+        try:
+            with self._get() as conn:
+                # Chunked to stay under SQLite's bound parameter limit
+                for start in range(0, len(episode_ids), IN_CHUNK_SIZE):
+                    chunk = episode_ids[start:start + IN_CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT id FROM episodes WHERE downloaded = 1 AND id IN ({placeholders})",
+                        chunk
+                    )
+                    downloaded.update(row[0] for row in rows)
+
+        except Exception as e:
+            logger.error("database.is_downloaded_check_failed", error=str(e))
+
+        return downloaded
+
     def search_anime(self, query: str) -> List[Dict]:
-        """Search anime by title"""
+        """Search anime by title (token prefix match, substring for very short queries)"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                SELECT * FROM anime
-                WHERE title LIKE ?
-                ORDER BY last_updated DESC
-            """, (f"%{query}%",))
-
-            rows = cursor.fetchall()
+            with self._get() as conn:
+                cursor = conn.cursor()
+
+                if self._fts and len(query.strip()) >= 2:
+                    # Quote every token so user input can't inject FTS syntax
+                    match = " ".join('"' + token.replace('"', '""') + '"*' for token in query.split())
+                    cursor.execute("""
+                        SELECT a.* FROM anime a
+                        JOIN anime_fts f ON f.rowid = a.rowid
+                        WHERE anime_fts MATCH ?
+                        ORDER BY f.rank
+                    """, (match,))
+                else:
+                    cursor.execute("""
+                        SELECT * FROM anime
+                        WHERE title LIKE ?
+                        ORDER BY last_updated DESC
+                    """, (f"%{query}%",))
+
+                rows = cursor.fetchall()
+
             return [dict(row) for row in rows]
 
         except Exception as e:
@@ -270,23 +517,24 @@ class Database:
     def get_download_stats(self) -> Dict:
         """Get download statistics"""
         try:
-            cursor = self.conn.cursor()
-
-            # Total anime
-            cursor.execute("SELECT COUNT(*) FROM anime")
-            total_anime = cursor.fetchone()[0]
-
-            # Total episodes
-            cursor.execute("SELECT COUNT(*) FROM episodes")
-            total_episodes = cursor.fetchone()[0]
-
-            # Downloaded episodes
-            cursor.execute("SELECT COUNT(*) FROM episodes WHERE downloaded = 1")
-            downloaded_episodes = cursor.fetchone()[0]
-
-            # Total size
-            cursor.execute("SELECT SUM(file_size) FROM episodes WHERE downloaded = 1")
-            total_size = cursor.fetchone()[0] or 0
+            with self._get() as conn:
+                cursor = conn.cursor()
+
+                # Counts and total size in a single pass over episodes
+                cursor.execute("""
+                    SELECT
+                        (SELECT COUNT(*) FROM anime),
+                        COUNT(*),
+                        SUM(downloaded = 1),
+                        SUM(CASE WHEN downloaded = 1 THEN file_size ELSE 0 END)
+                    FROM episodes
+                """)
+                row = cursor.fetchone()
+
+            total_anime = row[0]
+            total_episodes = row[1]
+            downloaded_episodes = row[2] or 0
+            total_size = row[3] or 0
 
             return {
                 "total_anime": total_anime,
@@ -301,10 +549,17 @@ class Database:
             logger.error("database.stats_failed", error=str(e))
             return {}
 
+    def flush(self):
+        """Commit any pending transaction and checkpoint the WAL to disk"""
+        with self._get() as conn:
+            conn.commit()
+            conn.execute("PRAGMA wal_checkpoint(FULL)")
+
     def close(self):
-        """Close database connection"""
-        if self.conn:
-            self.conn.close()
+        """Close all pooled database connections"""
+        for conn in self._conns:
+            conn.close()
+        self._conns.clear()
 
     def __enter__(self):
         return self
@@ -4,18 +4,52 @@ Handles downloading with Axel, retry logic, and resume support
 """
 
 import os
+import re
 import time
+import random
 import sys
 import subprocess
 import shutil
+import functools
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Callable
-from ..utils.axel_manager import AxelManager, AxelError
-from ..ui.logger import get_logger, get_progress, console
-from rich.progress import TaskID
+from typing import Optional, Callable, Dict, List, Tuple
+from ..utils.axel_manager import AxelManager
+from ..utils.http import get_session, POOL_MAXSIZE
+from ..ui.logger import get_logger, console
 
 logger = get_logger(__name__)
 
+# Retry backoff in seconds: BACKOFF_BASE doubled per retry, never above BACKOFF_MAX
+BACKOFF_BASE = 1
+BACKOFF_MAX = 60
+
+# Seconds a free disk space measurement is reused between downloads
+DISK_FREE_TTL = 5
+
+# Most files sized with HEAD requests by check_batch_space; their mean stands in for the rest
+BATCH_SIZE_SAMPLE = 4
+
+# Anything but letters, digits, spaces, "-" and "_" is dropped from titles used in filenames
+_UNSAFE_TITLE_CHARS = re.compile(r"[^\w \-]")
+
+
+@functools.lru_cache(maxsize=128)
+def _safe_title(title: str) -> str:
+    """Title with filename-unsafe characters removed, cached across episodes and instances"""
+    return _UNSAFE_TITLE_CHARS.sub("", title).strip()
+
+
+def _tail_lines(output: Optional[bytes], count: int) -> list:
+    """Decode only the last count non-empty lines of a process' output"""
+    if not output:
+        return []
+    lines = output.strip().splitlines()[-count:]
+    return [line.decode("utf-8", errors="replace") for line in lines]
+
 
 class DownloadManager:
     """Manages downloads using Axel with retry and resume support"""
@@ -23,7 +57,42 @@ class DownloadManager:
     def __init__(self, axel_manager: AxelManager, config: dict):
         self.axel_manager = axel_manager
         self.config = config
-        self.current_download: Optional[Path] = None
+        # Set by cancel(); checked between attempts so worker threads stop retrying
+        self.cancel_event = threading.Event()
+        self._processes = set()
+        self._processes_lock = threading.Lock()
+        # Directory -> (measured at, free bytes), see _free_bytes()
+        self._free_cache: Dict[Path, Tuple[float, int]] = {}
+        self._free_cache_lock = threading.Lock()
+
+    def cancel(self):
+        """Stop retries and terminate every running Axel process"""
+        self.cancel_event.set()
+        with self._processes_lock:
+            processes = list(self._processes)
+        for process in processes:
+            if process.poll() is None:
+                process.terminate()
+
+    def _free_bytes(self, path: Path) -> int:
+        """Free space at path, reusing a measurement up to DISK_FREE_TTL seconds old"""
+        now = time.monotonic()
+        with self._free_cache_lock:
+            cached = self._free_cache.get(path)
+            if cached is not None and now - cached[0] < DISK_FREE_TTL:
+                return cached[1]
+
+        free = shutil.disk_usage(path).free
+        with self._free_cache_lock:
+            self._free_cache[path] = (now, free)
+        return free
+
+    def _consume_free(self, path: Path, size: int):
+        """Account for size bytes just written under path in the cached free space"""
+        with self._free_cache_lock:
+            cached = self._free_cache.get(path)
+            if cached is not None:
+                self._free_cache[path] = (cached[0], max(0, cached[1] - size))
 
     def check_disk_space(self, path: Path, required_mb: int = 100) -> bool:
         """
@@ -37,8 +106,7 @@ class DownloadManager:
             bool: True if enough space available
         """
         try:
-            stat = shutil.disk_usage(path)
-            available_gb = stat.free / (1024 ** 3)
+            available_gb = self._free_bytes(path) / (1024 ** 3)
             required_gb = required_mb / 1024
 
             if available_gb < required_gb:
@@ -54,14 +122,69 @@ class DownloadManager:
             logger.error("download.disk_space_check_failed", error=str(e))
             return True  # Continue anyway
 
+    def check_batch_space(
+        self,
+        path: Path,
+        urls: List[Optional[str]],
+        batch_size: int,
+        required_mb: int = 100
+    ) -> Tuple[bool, List[Optional[int]]]:
+        """
+        Check upfront that a whole batch of downloads fits on disk
+
+        Only the first BATCH_SIZE_SAMPLE URLs are sized with HEAD requests
+        (get_file_size); the batch is estimated as batch_size files of their
+        mean size, so an "all" batch costs no more requests than a short one.
+
+        Args:
+            path: Directory the batch is downloaded into
+            urls: Download URLs of the first files in the batch; None is skipped
+            batch_size: Files in the whole batch
+            required_mb: Space in MB that must remain free after the batch
+
+        Returns:
+            Tuple[bool, List[Optional[int]]]: True if enough space available, and
+            the size of each file in urls where it was fetched
+        """
+        sizes: List[Optional[int]] = [None] * len(urls)
+        sample = [index for index, url in enumerate(urls) if url][:BATCH_SIZE_SAMPLE]
+        if not sample or not self.config.get("download", {}).get("check_disk_space", True):
+            return True, sizes
+
+        try:
+            path.mkdir(parents=True, exist_ok=True)
+            with ThreadPoolExecutor(max_workers=min(POOL_MAXSIZE, len(sample))) as executor:
+                for index, size in zip(sample, executor.map(self.get_file_size, [urls[i] for i in sample])):
+                    sizes[index] = size
+            known = [size for size in sizes if size]
+            if not known:
+                return True, sizes
+            batch_bytes = sum(known) * batch_size // len(known)
+            remaining = self._free_bytes(path) - batch_bytes
+
+        except Exception as e:
+            logger.error("download.disk_space_check_failed", error=str(e))
+            return True, sizes  # Continue anyway
+
+        if remaining < required_mb * 1024 ** 2:
+            logger.error(
+                "download.disk_space_batch",
+                required=f"{batch_bytes / 1024 ** 3:.2f}",
+                available=f"{(remaining + batch_bytes) / 1024 ** 3:.2f}"
+            )
+            return False, sizes
+
+        return True, sizes
+
     def download(
         self,
         url: str,
         output_path: Path,
         connections: int = 4,
         resume: bool = True,
-        progress_callback: Optional[Callable] = None
-    ) -> bool:
+        progress_callback: Optional[Callable] = None,
+        show_output: bool = True
+    ) -> Optional[int]:
         """
         Download file using Axel
 
@@ -71,9 +194,10 @@ class DownloadManager:
             connections: Number of connections
             resume: Enable resume support
             progress_callback: Optional callback for progress updates
+            show_output: Pass Axel's output through to the terminal; off when several downloads share it
 
         Returns:
-            bool: True if download succeeded
+            Optional[int]: Size of the downloaded file in bytes, None if the download failed
         """
         try:
             # Ensure output directory exists
@@ -83,7 +207,7 @@ class DownloadManager:
             if self.config.get("download", {}).get("check_disk_space", True):
                 if not self.check_disk_space(output_path.parent):
                     logger.error("download.failed", error="Insufficient disk space")
-                    return False
+                    return None
 
             # Clean up partial download files from previous failed attempts
             # Axel creates .st files for resume state
@@ -97,9 +221,6 @@ class DownloadManager:
                 logger.debug("download.removing_partial_file", file=str(output_path))
                 output_path.unlink()
 
-            # Store current download for interrupt handling
-            self.current_download = output_path
-
             console.print(f"[cyan]Downloading:[/cyan] {output_path.name}")
 
             # Build Axel command with quiet flag to suppress connection messages
@@ -116,28 +237,54 @@ class DownloadManager:
             # Let Axel show its own progress bar by not capturing stdout
             process = subprocess.Popen(
                 cmd,
-                stdout=sys.stdout,  # Show Axel's progress bar
-                stderr=subprocess.PIPE,  # Capture errors
-                text=True
+                stdout=sys.stdout if show_output else subprocess.DEVNULL,  # Show Axel's progress bar
+                stderr=subprocess.PIPE  # Capture errors as raw bytes, decoded only on failure
             )
+            with self._processes_lock:
+                self._processes.add(process)
 
-            # Wait for completion
-            _, stderr_output = process.communicate()
+            # Read stderr as it arrives, keeping only the tail shown on failure,
+            # so a chatty run never holds its whole output in memory
+            stderr_tail = deque(maxlen=16)
+            try:
+                # Branch once, not per line: without debug logging the deque
+                # drains the pipe itself
+                if logger.logger.isEnabledFor(logging.DEBUG):
+                    for line in process.stderr:
+                        stderr_tail.append(line)
+                        logger.debug("axel.output", output=line.decode("utf-8", errors="replace").rstrip())
+                else:
+                    stderr_tail.extend(process.stderr)
+
+                # Wait for completion
+                process.wait()
+            finally:
+                with self._processes_lock:
+                    self._processes.discard(process)
+
+            # Terminated by cancel(): not a failure worth reporting
+            if process.returncode != 0 and self.cancel_event.is_set():
+                return None
 
             if process.returncode == 0:
                 console.print(f"[green]✓[/green] Completed: {output_path.name}")
-                self.current_download = None
-                return True
+                # One stat serves both the free space estimate and the caller
+                try:
+                    size = output_path.stat().st_size
+                except OSError:
+                    size = 0
+                self._consume_free(output_path.parent, size)
+                return size
             else:
                 # Show error output
-                error_lines = stderr_output.strip().split('\n')[-5:] if stderr_output else []
+                error_lines = _tail_lines(b"".join(stderr_tail), 5)
                 error_output = "\n".join(error_lines) if error_lines else "No error output"
                 logger.error("download.failed", error=f"Axel exited with code {process.returncode}", details=error_output)
                 raise DownloadError(f"Axel failed (code {process.returncode}): {error_output}")
 
         except Exception as e:
             logger.error("download.failed", error=str(e))
-            return False
+            return None
 
     def download_with_retry(
         self,
@@ -145,8 +292,9 @@ class DownloadManager:
         output_path: Path,
         connections: int = 4,
         max_attempts: int = 3,
-        backoff: bool = True
-    ) -> bool:
+        backoff: bool = True,
+        show_output: bool = True
+    ) -> Optional[int]:
         """
         Download with retry and exponential backoff
 
@@ -156,28 +304,39 @@ class DownloadManager:
             connections: Number of connections
             max_attempts: Maximum retry attempts
             backoff: Use exponential backoff
+            show_output: Pass Axel's output through to the terminal
 
         Returns:
-            bool: True if download succeeded
+            Optional[int]: Size of the downloaded file in bytes, None if every attempt failed
         """
         attempt = 1
-        wait_time = 1  # Initial wait time in seconds
+
+        # Exponential backoff capped at BACKOFF_MAX, plus jitter so downloads
+        # failing together do not all retry at the same moment
+        delays = [
+            min(BACKOFF_MAX, BACKOFF_BASE * (1 << retry)) + random.uniform(0, BACKOFF_BASE)
+            for retry in range(max_attempts - 1)
+        ]
 
         while attempt <= max_attempts:
+            if self.cancel_event.is_set():
+                return None
+
             try:
                 if attempt > 1:
                     logger.info("download.retrying", attempt=attempt, max_attempts=max_attempts)
 
                     if backoff:
-                        logger.debug("download.backoff_wait", seconds=wait_time)
-                        time.sleep(wait_time)
-                        wait_time *= 2  # Exponential backoff
+                        wait_time = delays[attempt - 2]
+                        logger.debug("download.backoff_wait", seconds=f"{wait_time:.1f}")
+                        if self.cancel_event.wait(wait_time):
+                            return None
 
                 # Attempt download
-                success = self.download(url, output_path, connections)
+                size = self.download(url, output_path, connections, show_output=show_output)
 
-                if success:
-                    return True
+                if size is not None:
+                    return size
 
                 attempt += 1
 
@@ -197,7 +356,7 @@ class DownloadManager:
                 attempt += 1
 
         logger.error("download.failed_all_attempts", attempts=max_attempts)
-        return False
+        return None
 
     def get_file_size(self, url: str) -> Optional[int]:
         """
@@ -209,10 +368,8 @@ class DownloadManager:
         Returns:
             Optional[int]: File size in bytes or None
         """
-        import requests
-
         try:
-            response = requests.head(url, timeout=10, allow_redirects=True)
+            response = get_session().head(url, timeout=10, allow_redirects=True)
             size = response.headers.get('Content-Length')
             if size:
                 return int(size)
@@ -247,16 +404,16 @@ class DownloadManager:
         if pattern == "original" and original_filename:
             return original_filename
 
+        safe_title = _safe_title(anime_title)
+
         if pattern == "season_episode":
             # Format: Anime Name - S01E01.mp4
-            safe_title = "".join(c for c in anime_title if c.isalnum() or c in (' ', '-', '_')).strip()
             return f"{safe_title} - S{season:02d}E{episode_number:02d}.{extension}"
 
         if pattern == "custom":
             # Use custom pattern from config
             custom = self.config.get("download", {}).get("custom_pattern", "")
             if custom:
-                safe_title = "".join(c for c in anime_title if c.isalnum() or c in (' ', '-', '_')).strip()
                 try:
                     return custom.format(
                         anime_name=safe_title,
@@ -268,7 +425,6 @@ class DownloadManager:
                     pass
 
         # Fallback to simple format
-        safe_title = "".join(c for c in anime_title if c.isalnum() or c in (' ', '-', '_')).strip()
         return f"{safe_title} - {episode_number:02d}.{extension}"
 
     def cleanup_partial(self, output_path: Path):
@@ -4,29 +4,279 @@ Handles scraping and parsing of AnimeWorld website
 """
 
 import re
+import time
+import asyncio
+import functools
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional, Tuple
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import List, Dict, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
 from ..ui.logger import get_logger
+from ..utils.http import get_session, POOL_MAXSIZE
 
 logger = get_logger(__name__)
 
 BASE_URL = "https://www.animeworld.ac"
+
+# Patterns used on every episode, card and script; compiled once
+_EP_NUM_RE = re.compile(r'(\d+)')
+_EP_URL_RE = re.compile(r'ep?(\d+)|episode[_-]?(\d+)', re.IGNORECASE)
+_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+# Video URLs in player scripts: "url":"...", 'src':'...', etc.
+_VIDEO_URL_RE = re.compile(r'["\'](?:url|src|file)["\']:\s*["\']([^"\']+\.(?:mp4|m3u8|mpd))["\']', re.IGNORECASE)
+
+# Sort key for episodes
+_BY_NUMBER = attrgetter("number")
+
+# CSS selectors, compiled once instead of on every select() call
+_SEL_CARDS = soupsieve.compile(".film-list .item, .anime-card, .film-poster")
+_SEL_CARD_TITLE = soupsieve.compile("a.name, .film-name, a[title]")
+_SEL_CARD_IMG = soupsieve.compile("img")
+_SEL_CARD_BADGE = soupsieve.compile(".dub, .badge")
+_SEL_ANIME_TITLE = soupsieve.compile("h1, .anime-title, .film-name")
+_SEL_ANIME_DESC = soupsieve.compile(".description, .film-description, .plot")
+_SEL_GENRES = soupsieve.compile(".genre a, .genres a")
+_SEL_EPISODES_A = soupsieve.compile(".episode-list a, .episodes a, .server.active a")
+_SEL_EPISODES_B = soupsieve.compile("a[href*='/play/']")
+
+# Tags get_video_url looks at
+_VIDEO_PAGE_STRAINER = SoupStrainer(["a", "script", "iframe"])
+
+# Seconds a fetched anime page stays valid for get_anime_info
+ANIME_INFO_TTL = 300
+
+# Most page body bytes kept for conditional revalidation
+HTTP_CACHE_BYTES = 8 * 1024 * 1024
+
+# Most resolved video URLs kept by get_video_url
+VIDEO_URL_CACHE_SIZE = 256
+
+# Most nested iframe pages get_video_url follows
+MAX_IFRAME_DEPTH = 3
+
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 }
 
 
+@dataclass(frozen=True)
+class AnimeHit:
+    """A search result"""
+    __slots__ = ("title", "id", "url", "image", "is_dub")
+
+    title: str
+    id: str
+    url: str
+    image: str
+    is_dub: bool
+
+
+@dataclass(frozen=True)
+class Episode:
+    """An episode listed on an anime page"""
+    __slots__ = ("number", "id", "url", "title")
+
+    number: int
+    id: str
+    url: str
+    title: str
+
+
+def _url_path_segments(url: str) -> List[str]:
+    """Non-empty "/"-separated segments of a URL's path, host, query and fragment dropped"""
+    if "://" in url:
+        url = url.partition("://")[2].partition("/")[2]
+    path = url.partition("?")[0].partition("#")[0]
+    return [segment for segment in path.split("/") if segment]
+
+
+def _anime_id_index(segments: List[str]) -> int:
+    """Index of the segment holding the anime ID, or -1"""
+    # First segment ending in "." plus ASCII letters and digits
+    for index, segment in enumerate(segments):
+        _, dot, candidate = segment.rpartition(".")
+        if dot and candidate.isascii() and candidate.isalnum():
+            return index
+    return -1
+
+
+def extract_id_from_url(url: str) -> str:
+    """
+    Extract the anime ID from an AnimeWorld URL
+
+    Pattern: /play/anime-name.ID or /play/anime-name.ID/episodeID. Only the
+    path is searched, so the host's ".ac" is never taken for an ID.
+
+    Args:
+        url: Absolute or site-relative URL
+
+    Returns:
+        str: ID, or "" if the URL has none
+    """
+    segments = _url_path_segments(url)
+    index = _anime_id_index(segments)
+    return segments[index].rpartition(".")[2] if index >= 0 else ""
+
+
+def extract_episode_id_from_url(url: str) -> str:
+    """
+    Extract the episode ID from an AnimeWorld episode URL
+
+    Pattern: /play/anime-name.ID/episodeID, the last path segment. A URL
+    without an episode segment is the anime page itself, which plays its
+    only episode, so the anime ID is returned.
+
+    Args:
+        url: Absolute or site-relative URL
+
+    Returns:
+        str: ID, or "" if the URL has none
+    """
+    segments = _url_path_segments(url)
+    index = _anime_id_index(segments)
+    if index < 0:
+        return ""
+    if index + 1 < len(segments):
+        return segments[-1]
+    return segments[index].rpartition(".")[2]
+
+
+def _absolutize(href: str, base: str = BASE_URL, origin: str = BASE_URL) -> str:
+    """
+    Resolve a link found on a page to an absolute URL
+
+    Site-relative and absolute links, almost every link on AnimeWorld, are
+    handled without the cost of urljoin's full URL parsing.
+
+    Args:
+        href: Link as found in the page
+        base: URL of the page the link was found on
+        origin: Scheme and host of base, without a trailing slash
+
+    Returns:
+        str: Absolute URL
+    """
+    if not href:
+        return href
+    if href[0] == "/" and href[:2] != "//":
+        return origin + href
+    if href.startswith(("http://", "https://")):
+        return href
+    return urljoin(base, href)
+
+
+def _parse(page: Tuple[bytes, str], parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """
+    Parse an HTML page with lxml
+
+    When the server declares a charset, BeautifulSoup is told to use it and
+    skips its own encoding detection pass over the body.
+
+    Args:
+        page: (body, Content-Type header) as returned by AlchemixScraper._get
+        parse_only: Restrict the tree to matching tags
+
+    Returns:
+        BeautifulSoup: Parsed page
+    """
+    content, content_type = page
+    match = _CHARSET_RE.search(content_type)
+    return BeautifulSoup(
+        content, 'lxml',
+        parse_only=parse_only,
+        from_encoding=match.group(1) if match else None
+    )
+
+
+def _run_in_thread(func, *args, **kwargs):
+    """Run a blocking call on the running loop's default executor"""
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
 class AlchemixScraper:
     """Scraper for AnimeWorld website"""
 
     def __init__(self, timeout: int = 10):
         self.timeout = timeout
-        self.session = requests.Session()
+        # Shared with the download manager so both reuse pooled connections
+        self.session = get_session()
         self.session.headers.update(HEADERS)
+        # anime_url -> (fetch time, info) for get_anime_info
+        self._anime_info_cache: Dict[str, Tuple[float, Dict]] = {}
+        # Request URL -> (ETag, Last-Modified, Content-Type, body) of the last
+        # page carrying a validator, see _get()
+        self._http_cache: "OrderedDict[str, Tuple[Optional[str], Optional[str], str, bytes]]" = OrderedDict()
+        self._http_cache_bytes = 0
+        self._http_cache_lock = threading.Lock()
+        # Page URL -> resolved video URL, see get_video_url()
+        self._video_url_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._video_url_cache_lock = threading.Lock()
+
+    def _get(self, url: str, params: Optional[Dict] = None) -> Tuple[bytes, str]:
+        """
+        GET a page, revalidating a previously fetched copy
+
+        Pages served with an ETag or Last-Modified header keep their validators
+        and body in memory, up to HTTP_CACHE_BYTES in total, and the next
+        request for them is conditional: a 304 reply reuses the stored body
+        without transferring it again.
+
+        Args:
+            url: Page URL
+            params: Query string parameters
 
-    def search_anime(self, query: str) -> List[Dict]:
+        Returns:
+            Tuple[bytes, str]: Page body and its Content-Type header
+        """
+        key = requests.Request("GET", url, params=params).prepare().url
+
+        with self._http_cache_lock:
+            cached = self._http_cache.get(key)
+
+        headers = {}
+        if cached is not None:
+            etag, last_modified, _, _ = cached
+            if etag is not None:
+                headers["If-None-Match"] = etag
+            if last_modified is not None:
+                headers["If-Modified-Since"] = last_modified
+
+        response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+
+        if response.status_code == 304 and cached is not None:
+            with self._http_cache_lock:
+                if key in self._http_cache:
+                    self._http_cache.move_to_end(key)
+            return cached[3], cached[2]
+
+        response.raise_for_status()
+
+        content = response.content
+        content_type = response.headers.get("Content-Type", "")
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+
+        if (etag is not None or last_modified is not None) and len(content) <= HTTP_CACHE_BYTES:
+            with self._http_cache_lock:
+                previous = self._http_cache.pop(key, None)
+                if previous is not None:
+                    self._http_cache_bytes -= len(previous[3])
+                self._http_cache[key] = (etag, last_modified, content_type, content)
+                self._http_cache_bytes += len(content)
+                while self._http_cache_bytes > HTTP_CACHE_BYTES:
+                    _, evicted = self._http_cache.popitem(last=False)
+                    self._http_cache_bytes -= len(evicted[3])
+
+        return content, content_type
+
+    def search_anime(self, query: str) -> List[AnimeHit]:
         """
         Search for anime by title
 
@@ -34,7 +284,7 @@ class AlchemixScraper:
             query: Search query
 
         Returns:
-            List[Dict]: List of anime results
+            List[AnimeHit]: List of anime results
         """
         try:
             logger.info("scraper.searching", query=query)
@@ -43,54 +293,52 @@ class AlchemixScraper:
             search_url = f"{BASE_URL}/search"
             params = {"keyword": query}
 
-            response = self.session.get(search_url, params=params, timeout=self.timeout)
-            response.raise_for_status()
+            page = self._get(search_url, params=params)
 
-            soup = BeautifulSoup(response.content, 'lxml')
+            soup = _parse(page)
 
             results = []
 
             # Parse search results - adjust selectors based on actual HTML structure
-            anime_cards = soup.select(".film-list .item, .anime-card, .film-poster")
+            anime_cards = _SEL_CARDS.select(soup)
 
             for card in anime_cards:
                 try:
                     # Extract title
-                    title_elem = card.select_one("a.name, .film-name, a[title]")
+                    title_elem = _SEL_CARD_TITLE.select_one(card)
                     if not title_elem:
                         continue
 
                     title = title_elem.get_text(strip=True)
-                    link = title_elem.get("href", "")
-
-                    if not link.startswith("http"):
-                        link = urljoin(BASE_URL, link)
+                    link = _absolutize(title_elem.get("href", ""))
 
                     # Extract ID from link (e.g., /play/anime-name.idHere)
                     anime_id = self._extract_id_from_url(link)
 
                     # Extract image
-                    img_elem = card.select_one("img")
+                    img_elem = _SEL_CARD_IMG.select_one(card)
                     image = img_elem.get("src", "") if img_elem else ""
-                    if image and not image.startswith("http"):
-                        image = urljoin(BASE_URL, image)
+                    image = _absolutize(image)
 
                     # Check for dub/sub badge
-                    badge = card.select_one(".dub, .badge")
+                    badge = _SEL_CARD_BADGE.select_one(card)
                     is_dub = "DUB" in badge.get_text(strip=True).upper() if badge else False
 
-                    results.append({
-                        "title": title,
-                        "id": anime_id,
-                        "url": link,
-                        "image": image,
-                        "is_dub": is_dub
-                    })
+                    results.append(AnimeHit(
+                        title=title,
+                        id=anime_id,
+                        url=link,
+                        image=image,
+                        is_dub=is_dub
+                    ))
 
                 except Exception as e:
-                    logger.debug("scraper.card_parse_error", error=str(e))
+                    logger.debug_lazy("scraper.card_parse_error", error=str(e))
                     continue
 
+            # Results hold plain strings only: free the tree's reference cycles now
+            soup.decompose()
+
             logger.success("scraper.search_complete", count=len(results))
             return results
 
@@ -98,43 +346,48 @@ class AlchemixScraper:
             logger.error("scraper.search_failed", error=str(e))
             raise ScraperError(f"Search failed: {e}")
 
-    def get_anime_info(self, anime_url: str) -> Dict:
+    def get_anime_info(self, anime_url: str, refresh: bool = False) -> Dict:
         """
         Get detailed anime information and episode list
 
         Args:
             anime_url: URL to anime page
+            refresh: Ignore a cached copy and fetch the page again
 
         Returns:
             Dict: Anime information including episodes
         """
+        # Listing and then downloading the same anime fetches its page only once
+        cached = self._anime_info_cache.get(anime_url)
+        if cached is not None and not refresh and time.monotonic() - cached[0] < ANIME_INFO_TTL:
+            return cached[1]
+
         try:
             logger.info("scraper.fetching_info", url=anime_url)
 
-            response = self.session.get(anime_url, timeout=self.timeout)
-            response.raise_for_status()
+            page = self._get(anime_url)
 
-            soup = BeautifulSoup(response.content, 'lxml')
+            soup = _parse(page)
 
             # Extract anime info
-            title_elem = soup.select_one("h1, .anime-title, .film-name")
+            title_elem = _SEL_ANIME_TITLE.select_one(soup)
             title = title_elem.get_text(strip=True) if title_elem else "Unknown"
 
             # Extract description
-            desc_elem = soup.select_one(".description, .film-description, .plot")
+            desc_elem = _SEL_ANIME_DESC.select_one(soup)
             description = desc_elem.get_text(strip=True) if desc_elem else ""
 
             # Extract genres
             genres = []
-            genre_elems = soup.select(".genre a, .genres a")
+            genre_elems = _SEL_GENRES.select(soup)
             for genre in genre_elems:
                 genres.append(genre.get_text(strip=True))
 
-            # Extract episodes
-            episodes = self._extract_episodes(soup, anime_url)
+            # Extract episodes, grouped into seasons
+            episodes, seasons = self._extract_episodes(soup, anime_url)
 
-            # Detect seasons
-            seasons = self._detect_seasons(episodes)
+            # Everything needed is extracted: free the tree's reference cycles now
+            soup.decompose()
 
             anime_id = self._extract_id_from_url(anime_url)
 
@@ -150,189 +403,274 @@ class AlchemixScraper:
             }
 
             logger.success("scraper.info_fetched", title=title, episodes=len(episodes))
+            self._anime_info_cache[anime_url] = (time.monotonic(), info)
             return info
 
         except Exception as e:
             logger.error("scraper.info_failed", error=str(e))
             raise ScraperError(f"Failed to get anime info: {e}")
 
-    def _extract_episodes(self, soup: BeautifulSoup, base_url: str) -> List[Dict]:
-        """Extract episode list from anime page"""
+    def _extract_episodes(self, soup: BeautifulSoup, base_url: str) -> Tuple[List[Episode], Dict[int, List[Episode]]]:
+        """
+        Extract episode list from anime page and detect its seasons
+
+        Season detection is a heuristic approach - adjust based on actual HTML structure
+
+        Returns:
+            Tuple of episodes sorted by number and the same episodes grouped by season
+        """
         episodes = []
 
         # Try multiple selectors for episodes
         episode_elems = (
-            soup.select(".episode-list a, .episodes a, .server.active a") or
-            soup.select("a[href*='/play/']")
+            _SEL_EPISODES_A.select(soup) or
+            _SEL_EPISODES_B.select(soup)
         )
 
+        # Bound once: this loop runs for every episode link on the page
+        append = episodes.append
+        extract_number = self._extract_episode_number
+        extract_id = extract_episode_id_from_url
+        absolutize = _absolutize
+        origin = urljoin(base_url, "/").rstrip("/")
+
         for elem in episode_elems:
             try:
-                episode_text = elem.get_text(strip=True)
                 episode_url = elem.get("href", "")
 
                 if not episode_url:
                     continue
 
-                if not episode_url.startswith("http"):
-                    episode_url = urljoin(base_url, episode_url)
-
-                # Extract episode number from text or URL
-                episode_num = self._extract_episode_number(episode_text, episode_url)
+                episode_text = elem.get_text(strip=True)
 
-                # Extract episode ID from URL
-                episode_id = self._extract_id_from_url(episode_url)
+                episode_url = absolutize(episode_url, base_url, origin)
 
-                episodes.append({
-                    "number": episode_num,
-                    "id": episode_id,
-                    "url": episode_url,
-                    "title": episode_text
-                })
+                append(Episode(
+                    # Extract episode number from text or URL
+                    number=extract_number(episode_text, episode_url),
+                    # Extract episode ID from URL
+                    id=extract_id(episode_url),
+                    url=episode_url,
+                    title=episode_text
+                ))
 
             except Exception as e:
-                logger.debug("scraper.episode_parse_error", error=str(e))
+                logger.debug_lazy("scraper.episode_parse_error", error=str(e))
                 continue
 
         # Sort by episode number
-        episodes.sort(key=lambda x: x["number"])
+        episodes.sort(key=_BY_NUMBER)
+
+        if not episodes:
+            return episodes, {1: []}
+
+        # Simple approach: assume all episodes are season 1 unless we find markers
+        # In future, parse season markers from HTML if available
+
+        # Check for large gaps in episode numbers (might indicate season change)
+        current_season = 1
+        season_episodes = []
+        seasons = {1: season_episodes}
+        prev_num = episodes[0].number
+
+        for episode in episodes:
+            curr_num = episode.number
+
+            # If episode number resets or has large gap, might be new season
+            if curr_num < prev_num or (curr_num - prev_num) > 50:
+                current_season += 1
+                season_episodes = seasons[current_season] = []
 
-        return episodes
+            season_episodes.append(episode)
+            prev_num = curr_num
+
+        return episodes, seasons
 
     def _extract_episode_number(self, text: str, url: str) -> int:
         """Extract episode number from text or URL"""
+        # Episode links are usually just the number: skip the regex then
+        if text.isdecimal():
+            return int(text)
+
         # Try to find number in text first
-        match = re.search(r'(\d+)', text)
+        match = _EP_NUM_RE.search(text)
         if match:
             return int(match.group(1))
 
         # Try URL
-        match = re.search(r'ep?(\d+)|episode[_-]?(\d+)', url, re.IGNORECASE)
+        match = _EP_URL_RE.search(url)
         if match:
             return int(match.group(1) or match.group(2))
 
         return 0
 
-    def _detect_seasons(self, episodes: List[Dict]) -> Dict[int, List[Dict]]:
+    def get_video_url(self, episode_url: str) -> str:
         """
-        Detect seasons from episode list
+        Extract direct video download URL from episode page
+
+        Iframes are followed up to MAX_IFRAME_DEPTH pages deep, and resolved
+        URLs are remembered, so retrying an episode skips the page fetches.
+
+        Args:
+            episode_url: URL to episode player page
 
-        This is a heuristic approach - adjust based on actual HTML structure
+        Returns:
+            str: Direct download URL
         """
-        if not episodes:
-            return {1: []}
+        with self._video_url_cache_lock:
+            video_url = self._video_url_cache.get(episode_url)
+            if video_url is not None:
+                self._video_url_cache.move_to_end(episode_url)
+                return video_url
 
-        # Simple approach: assume all episodes are season 1 unless we find markers
-        # In future, parse season markers from HTML if available
+        try:
+            video_url = self._extract_video_url(episode_url, 0, {episode_url})
+        except Exception as e:
+            logger.error("scraper.video_extraction_failed", error=str(e))
+            raise ScraperError(f"Failed to extract video URL: {e}")
 
-        # Check for large gaps in episode numbers (might indicate season change)
-        seasons = {1: []}
-        current_season = 1
+        with self._video_url_cache_lock:
+            self._video_url_cache[episode_url] = video_url
+            while len(self._video_url_cache) > VIDEO_URL_CACHE_SIZE:
+                self._video_url_cache.popitem(last=False)
 
-        for i, episode in enumerate(episodes):
-            if i > 0:
-                prev_num = episodes[i - 1]["number"]
-                curr_num = episode["number"]
+        return video_url
 
-                # If episode number resets or has large gap, might be new season
-                if curr_num < prev_num or (curr_num - prev_num) > 50:
-                    current_season += 1
-                    seasons[current_season] = []
+    def _extract_video_url(self, page_url: str, depth: int, seen: Set[str]) -> str:
+        """
+        Extract the video URL from a page, following iframes
 
-            if current_season not in seasons:
-                seasons[current_season] = []
+        Args:
+            page_url: URL of an episode page or of a page embedded in one
+            depth: Iframes followed to reach this page
+            seen: Pages already visited on the way here
 
-            seasons[current_season].append(episode)
+        Returns:
+            str: Direct download URL, or the innermost iframe URL when no video link is found
+        """
+        logger.info("scraper.extracting_video", url=page_url)
+
+        page = self._get(page_url)
+
+        # Only links, scripts and iframes can carry the video URL:
+        # build the tree for those and skip every other node
+        soup = _parse(page, _VIDEO_PAGE_STRAINER)
+
+        # Try multiple methods to extract video URL, collecting the
+        # candidates for all of them in a single walk over the tree
+        alternative_href = None
+        mp4_href = None
+        iframe_src = None
+        script_texts = []
+
+        for tag in soup.find_all(["a", "script", "iframe"]):
+            name = tag.name
+            if name == "a":
+                href = tag.get("href", "")
+                if alternative_href is None and (
+                    tag.get("id") == "alternativeDownloadLink"
+                    or (tag.has_attr("download") and ".mp4" in href)
+                ):
+                    alternative_href = href
+                    # Highest priority method: nothing later in the page can win
+                    if href.endswith(".mp4"):
+                        break
+                if mp4_href is None and href.endswith(".mp4") and "download-file.php" not in href:
+                    mp4_href = href
+            elif name == "script":
+                # External and empty scripts have no text to scan
+                text = tag.string
+                if text:
+                    script_texts.append(str(text))
+            elif iframe_src is None:
+                iframe_src = tag.get("src", "")
+
+        # Only plain strings are kept: free the tree now rather than
+        # leaving its reference cycles to the garbage collector
+        soup.decompose()
+
+        # Links resolve against the page they were found on, which may be an
+        # embedded player on another host
+        origin = urljoin(page_url, "/").rstrip("/")
+
+        # Method 1: Look for alternative download link (direct MP4, not PHP)
+        # Priority: alternativeDownloadLink > download attribute > downloadLink
+        if alternative_href and alternative_href.endswith(".mp4"):
+            download_url = _absolutize(alternative_href, page_url, origin)
+            logger.success("scraper.video_found", url=download_url)
+            return download_url
+
+        # Method 2: Look for any direct .mp4 link (avoid PHP files)
+        if mp4_href:
+            download_url = _absolutize(mp4_href, page_url, origin)
+            logger.success("scraper.video_found", url=download_url)
+            return download_url
+
+        # Method 2: Look for video source in scripts
+        # One scan over all script text, stopping at the first match
+        match = _VIDEO_URL_RE.search("\n".join(script_texts)) if script_texts else None
+        if match:
+            video_url = _absolutize(match.group(1), page_url, origin)
+            logger.success("scraper.video_found", url=video_url)
+            return video_url
+
+        # Method 3: Look for iframe
+        if iframe_src:
+            # May need to scrape the iframe page too
+            logger.info("scraper.iframe_found", src=iframe_src)
+            iframe_src = _absolutize(iframe_src, page_url, origin)
+            # Recursively get video from iframe (with protection against infinite loops)
+            if depth < MAX_IFRAME_DEPTH and iframe_src not in seen:
+                seen.add(iframe_src)
+                try:
+                    return self._extract_video_url(iframe_src, depth + 1, seen)
+                except Exception as e:
+                    logger.debug_lazy("scraper.iframe_failed", src=iframe_src, error=str(e))
+            # Nothing better inside: the iframe URL is the best candidate
+            return iframe_src
 
-        return seasons
+        raise ScraperError("Could not find video URL")
 
-    def get_video_url(self, episode_url: str) -> str:
+    def get_video_urls(self, episode_urls: List[str], max_workers: int = 8) -> List[Optional[str]]:
         """
-        Extract direct video download URL from episode page
+        Extract video URLs for many episodes concurrently
 
         Args:
-            episode_url: URL to episode player page
+            episode_urls: URLs to episode player pages
+            max_workers: Most pages fetched at once
 
         Returns:
-            str: Direct download URL
+            List[Optional[str]]: Video URL per episode, in input order; None where extraction failed
         """
-        try:
-            logger.info("scraper.extracting_video", url=episode_url)
-
-            response = self.session.get(episode_url, timeout=self.timeout)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'lxml')
-
-            # Try multiple methods to extract video URL
-
-            # Method 1: Look for alternative download link (direct MP4, not PHP)
-            # Priority: alternativeDownloadLink > download attribute > downloadLink
-            alternative_link = soup.select_one("a#alternativeDownloadLink, a[download][href*='.mp4']")
-            if alternative_link:
-                download_url = alternative_link.get("href", "")
-                if download_url and download_url.endswith(".mp4"):
-                    if not download_url.startswith("http"):
-                        download_url = urljoin(BASE_URL, download_url)
-                    logger.success("scraper.video_found", url=download_url)
-                    return download_url
-
-            # Method 2: Look for any direct .mp4 link (avoid PHP files)
-            mp4_links = soup.select("a[href$='.mp4']")
-            for link in mp4_links:
-                download_url = link.get("href", "")
-                if download_url and "download-file.php" not in download_url:
-                    if not download_url.startswith("http"):
-                        download_url = urljoin(BASE_URL, download_url)
-                    logger.success("scraper.video_found", url=download_url)
-                    return download_url
-
-            # Method 2: Look for video source in scripts
-            scripts = soup.find_all("script")
-            for script in scripts:
-                script_text = script.string or ""
-
-                # Look for video URLs in JavaScript
-                # Common patterns: "url":"...", 'src':'...', etc.
-                url_matches = re.findall(
-                    r'["\'](?:url|src|file)["\']:\s*["\']([^"\']+\.(?:mp4|m3u8|mpd))["\']',
-                    script_text,
-                    re.IGNORECASE
-                )
-
-                if url_matches:
-                    video_url = url_matches[0]
-                    if not video_url.startswith("http"):
-                        video_url = urljoin(BASE_URL, video_url)
-                    logger.success("scraper.video_found", url=video_url)
-                    return video_url
-
-            # Method 3: Look for iframe
-            iframe = soup.select_one("iframe")
-            if iframe:
-                iframe_src = iframe.get("src", "")
-                if iframe_src:
-                    # May need to scrape the iframe page too
-                    logger.info("scraper.iframe_found", src=iframe_src)
-                    # Recursively get video from iframe (with protection against infinite loops)
-                    if not iframe_src.startswith("http"):
-                        iframe_src = urljoin(BASE_URL, iframe_src)
-                    # For now, return iframe URL - may need deeper scraping
-                    return iframe_src
-
-            raise ScraperError("Could not find video URL")
+        def resolve(episode_url: str) -> Optional[str]:
+            try:
+                return self.get_video_url(episode_url)
+            except ScraperError:
+                return None  # Already logged by get_video_url
 
-        except Exception as e:
-            logger.error("scraper.video_extraction_failed", error=str(e))
-            raise ScraperError(f"Failed to extract video URL: {e}")
+        # Requests share the session's connection pool, so more workers than it keeps gain nothing
+        workers = max(1, min(max_workers, POOL_MAXSIZE, len(episode_urls)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(resolve, episode_urls))
+
+    # Async variants: the session is blocking, so the request and the
+    # BeautifulSoup parse both run on the event loop's default executor
+
+    async def search_anime_async(self, query: str) -> List[AnimeHit]:
+        """search_anime without blocking the event loop"""
+        return await _run_in_thread(self.search_anime, query)
+
+    async def get_anime_info_async(self, anime_url: str, refresh: bool = False) -> Dict:
+        """get_anime_info without blocking the event loop"""
+        return await _run_in_thread(self.get_anime_info, anime_url, refresh=refresh)
+
+    async def get_video_url_async(self, episode_url: str) -> str:
+        """get_video_url without blocking the event loop"""
+        return await _run_in_thread(self.get_video_url, episode_url)
 
     def _extract_id_from_url(self, url: str) -> str:
         """Extract ID from AnimeWorld URL"""
-        # Pattern: /play/anime-name.ID or /play/anime-name.ID/episodeID
-        match = re.search(r'\.([a-zA-Z0-9]+)(?:/|$)', url)
-        if match:
-            return match.group(1)
-        return ""
+        return extract_id_from_url(url)
 
 
 class ScraperError(Exception):
@@ -3,16 +3,62 @@ AnimeWorld Downloader - Speed Test Module
 Handles internet speed testing and connection optimization
 """
 
-import speedtest
+import math
+import time
+import bisect
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Tuple, Optional
+from .config import CONNECTION_TIERS
 from ..ui.logger import get_logger
+from ..utils.http import get_session
 
 logger = get_logger(__name__)
 
+# Cloudflare's speed test endpoints: __down serves the requested number of
+# bytes, __up accepts and discards a request body
+SPEED_TEST_DOWN_URL = "https://speed.cloudflare.com/__down"
+SPEED_TEST_UP_URL = "https://speed.cloudflare.com/__up"
+
+# Parallel streams per direction, like a multi-connection download
+SPEED_TEST_STREAMS = 4
+# Seconds each direction is measured for
+SPEED_TEST_WINDOW = 5.0
+# Bytes requested per download stream; more than a stream can fetch in the window
+SPEED_TEST_DOWN_BYTES = 25 * 1024 * 1024
+# Most bytes sent per upload request; the body is cut short at the window's end
+SPEED_TEST_UP_BYTES = 2 * 1024 * 1024
+# Latency samples; the lowest is reported
+PING_SAMPLES = 5
+CHUNK_SIZE = 64 * 1024
+
+# Connection tiers by lower bound, and those bounds for binary search
+_TIERS = sorted(CONNECTION_TIERS)
+_TIER_STARTS = [min_speed for min_speed, _, _ in _TIERS]
+
+# Tier names by speed: _TIER_NAMES[i] covers speeds below _TIER_NAME_THRESHOLDS[i]
+_TIER_NAME_THRESHOLDS = [20, 100, 200, 500, 1000, 1500]
+_TIER_NAMES = ("very_slow", "slow", "medium", "fast", "very_fast", "gigabit", "ultra")
+
+
+@functools.lru_cache(maxsize=64)
+def _tier_info(speed_mbps: float) -> tuple:
+    """(connections, tier name, min speed, max speed or None) for a speed"""
+    index = bisect.bisect_right(_TIER_STARTS, speed_mbps) - 1
+    if index >= 0:
+        min_speed, max_speed, connections = _TIERS[index]
+        if min_speed <= speed_mbps < max_speed:
+            tier = _TIER_NAMES[bisect.bisect_right(_TIER_NAME_THRESHOLDS, speed_mbps)]
+            return connections, tier, min_speed, max_speed if max_speed != float('inf') else None
+
+    # Fallback
+    return 4, "unknown", 0, None
+
 
 class SpeedTester:
-    """Handles speed testing using speedtest-cli"""
+    """Handles speed testing with parallel HTTP transfers"""
 
     def __init__(self, timeout: int = 30):
         self.timeout = timeout
@@ -29,23 +75,17 @@ class SpeedTester:
             if show_progress:
                 logger.info("speed_test.starting")
 
-            st = speedtest.Speedtest()
-
             if show_progress:
-                logger.info("speed_test.server_select")
-            st.get_best_server()
+                logger.info("speed_test.ping")
+            ping = self._measure_ping()
 
             if show_progress:
                 logger.info("speed_test.download")
-            download_bps = st.download()
-            download_mbps = download_bps / 1_000_000  # Convert to Mbps
+            download_mbps = self._measure_throughput(self._download_stream)
 
             if show_progress:
                 logger.info("speed_test.upload")
-            upload_bps = st.upload()
-            upload_mbps = upload_bps / 1_000_000
-
-            ping = st.results.ping
+            upload_mbps = self._measure_throughput(self._upload_stream)
 
             self.last_result = (download_mbps, upload_mbps, ping)
 
@@ -61,6 +101,79 @@ class SpeedTester:
             logger.error("speed_test.failed", error=str(e))
             raise SpeedTestError(f"Speed test failed: {e}")
 
+    def _measure_ping(self) -> float:
+        """Lowest round trip time of an empty request, in milliseconds"""
+        session = get_session()
+        best = float("inf")
+        for _ in range(PING_SAMPLES):
+            start = time.perf_counter()
+            response = session.get(SPEED_TEST_DOWN_URL, params={"bytes": 0}, timeout=self.timeout)
+            response.raise_for_status()
+            best = min(best, time.perf_counter() - start)
+        return best * 1000
+
+    def _measure_throughput(self, stream) -> float:
+        """
+        Run SPEED_TEST_STREAMS copies of a transfer for SPEED_TEST_WINDOW seconds
+
+        Args:
+            stream: Callable(deadline, add) transferring data until deadline,
+                reporting each transferred byte count through add
+
+        Returns:
+            float: Combined throughput in Mbps
+        """
+        transferred = [0]
+        lock = threading.Lock()
+
+        def add(count: int):
+            with lock:
+                transferred[0] += count
+
+        start = time.perf_counter()
+        deadline = start + SPEED_TEST_WINDOW
+        with ThreadPoolExecutor(max_workers=SPEED_TEST_STREAMS) as pool:
+            futures = [pool.submit(stream, deadline, add) for _ in range(SPEED_TEST_STREAMS)]
+            for future in futures:
+                future.result()
+        # Streams count nothing past the deadline, so neither does the elapsed time
+        elapsed = min(time.perf_counter(), deadline) - start
+
+        if not transferred[0]:
+            raise SpeedTestError("No data transferred")
+        return transferred[0] * 8 / elapsed / 1_000_000
+
+    def _download_stream(self, deadline: float, add):
+        """Download from the test endpoint until deadline"""
+        session = get_session()
+        while time.perf_counter() < deadline:
+            with session.get(SPEED_TEST_DOWN_URL, params={"bytes": SPEED_TEST_DOWN_BYTES},
+                             stream=True, timeout=self.timeout) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    add(len(chunk))
+                    if time.perf_counter() >= deadline:
+                        return
+
+    def _upload_stream(self, deadline: float, add):
+        """Upload to the test endpoint until deadline"""
+        session = get_session()
+        chunk = bytes(CHUNK_SIZE)
+
+        def body():
+            # A chunk is counted once the connection asks for the next one, and the
+            # (chunked) body ends at the deadline, so a slow uplink is measured
+            # over the window rather than over a whole request that outlasts it
+            sent = 0
+            while sent < SPEED_TEST_UP_BYTES and time.perf_counter() < deadline:
+                yield chunk
+                sent += CHUNK_SIZE
+                add(CHUNK_SIZE)
+
+        while time.perf_counter() < deadline:
+            response = session.post(SPEED_TEST_UP_URL, data=body(), timeout=self.timeout)
+            response.raise_for_status()
+
     def test_with_retry(self, max_attempts: int = 3) -> Tuple[float, float, float]:
         """
         Run speed test with retry logic
@@ -95,41 +208,15 @@ class SpeedTester:
         Returns:
             dict: Tier information including connections and tier name
         """
-        from .config import CONNECTION_TIERS
-
-        for min_speed, max_speed, connections in CONNECTION_TIERS:
-            if min_speed <= speed_mbps < max_speed:
-                # Determine tier name
-                if speed_mbps < 20:
-                    tier = "very_slow"
-                elif speed_mbps < 100:
-                    tier = "slow"
-                elif speed_mbps < 200:
-                    tier = "medium"
-                elif speed_mbps < 500:
-                    tier = "fast"
-                elif speed_mbps < 1000:
-                    tier = "very_fast"
-                elif speed_mbps < 1500:
-                    tier = "gigabit"
-                else:
-                    tier = "ultra"
-
-                return {
-                    "speed_mbps": speed_mbps,
-                    "connections": connections,
-                    "tier": tier,
-                    "min_speed": min_speed,
-                    "max_speed": max_speed if max_speed != float('inf') else None
-                }
-
-        # Fallback
+        # Tier bounds are whole Mbps, so speeds sharing a 0.1 Mbps bucket share a tier
+        key = math.floor(speed_mbps * 10) / 10 if math.isfinite(speed_mbps) else speed_mbps
+        connections, tier, min_speed, max_speed = _tier_info(key)
         return {
             "speed_mbps": speed_mbps,
-            "connections": 4,
-            "tier": "unknown",
-            "min_speed": 0,
-            "max_speed": None
+            "connections": connections,
+            "tier": tier,
+            "min_speed": min_speed,
+            "max_speed": max_speed
         }
 
     def format_speed(self, mbps: float, include_mbs: bool = True) -> str:
@@ -3,141 +3,95 @@ AnimeWorld Downloader - i18n (Internationalization)
 Translations for Italian and English
 """
 
+# Supported languages, in the order their strings appear in TRANSLATIONS
+LANGUAGES = ("en", "it")
+LANG_IDX = {language: index for index, language in enumerate(LANGUAGES)}
+
+
+class _SafeDict(dict):
+    """Format arguments that leave unknown placeholders as-is instead of raising"""
+
+    def __missing__(self, key):
+        return "{" + key + "}"
+
+
+# Translation key -> (English, Italian)
 TRANSLATIONS = {
-    "en": {
-        # Speed test
-        "speed_test.starting": "Starting speed test...",
-        "speed_test.server_select": "Selecting best server...",
-        "speed_test.download": "Testing download speed...",
-        "speed_test.upload": "Testing upload speed...",
-        "speed_test.completed": "Speed test completed: {download} Mbps down, {upload} Mbps up, {ping} ms ping",
-        "speed_test.failed": "Speed test failed: {error}",
-        "speed_test.attempt": "Attempt {current}/{total}...",
-        "speed_test.retry": "Retrying speed test (attempt {attempt})...",
-
-        # Axel
-        "axel.found_system": "Found system Axel at: {path}",
-        "axel.macos_detected": "macOS detected - please install Axel via Homebrew",
-        "axel.unsupported_platform": "Unsupported platform: {platform}/{arch}",
-        "axel.binary_exists": "Axel binary already exists: {path}",
-        "axel.downloading": "Downloading Axel binary from {url}...",
-        "axel.download_progress": "Download progress: {percent}%",
-        "axel.downloaded": "Axel binary downloaded: {path}",
-        "axel.download_failed": "Failed to download Axel: {error}",
-        "axel.version_check_failed": "Failed to check Axel version: {error}",
-
-        # Scraper
-        "scraper.searching": "Searching for: {query}",
-        "scraper.search_complete": "Found {count} results",
-        "scraper.search_failed": "Search failed: {error}",
-        "scraper.fetching_info": "Fetching anime info from {url}",
-        "scraper.info_fetched": "Loaded '{title}' with {episodes} episodes",
-        "scraper.info_failed": "Failed to fetch anime info: {error}",
-        "scraper.episode_parse_error": "Error parsing episode: {error}",
-        "scraper.extracting_video": "Extracting video URL from {url}",
-        "scraper.video_found": "Video URL found: {url}",
-        "scraper.video_extraction_failed": "Failed to extract video URL: {error}",
-        "scraper.iframe_found": "Found iframe source: {src}",
-        "scraper.card_parse_error": "Error parsing anime card: {error}",
-
-        # Download
-        "download.starting": "Starting download: {filename}",
-        "download.completed": "Download completed: {filename}",
-        "download.failed": "Download failed: {error}",
-        "download.retrying": "Retrying download (attempt {attempt}/{max_attempts})...",
-        "download.resumed": "Resuming download: {filename}",
-        "download.disk_space_low": "Warning: Low disk space ({available} GB available)",
-        "download.disk_space_check": "Checking disk space...",
-
-        # CLI
-        "cli.welcome": "AnimeWorld Downloader v{version}",
-        "cli.config_created": "Configuration created at: {path}",
-        "cli.no_results": "No results found for: {query}",
-        "cli.select_anime": "Select an anime:",
-        "cli.select_episodes": "Select episodes to download:",
-        "cli.select_quality": "Select quality:",
-        "cli.select_sub_dub": "Select Sub-ITA or Dub-ITA:",
-
-        # Errors
-        "error.no_video_url": "Could not find video download URL",
-        "error.invalid_episode_range": "Invalid episode range: {range}",
-        "error.config_load_failed": "Failed to load configuration: {error}",
-
-        # General
-        "general.yes": "Yes",
-        "general.no": "No",
-        "general.cancel": "Cancel",
-        "general.continue": "Continue",
-        "general.sub_ita": "Sub-ITA",
-        "general.dub_ita": "Dub-ITA",
-    },
-    "it": {
-        # Speed test
-        "speed_test.starting": "Avvio speed test...",
-        "speed_test.server_select": "Selezione del miglior server...",
-        "speed_test.download": "Test velocità download...",
-        "speed_test.upload": "Test velocità upload...",
-        "speed_test.completed": "Speed test completato: {download} Mbps down, {upload} Mbps up, {ping} ms ping",
-        "speed_test.failed": "Speed test fallito: {error}",
-        "speed_test.attempt": "Tentativo {current}/{total}...",
-        "speed_test.retry": "Nuovo tentativo speed test ({attempt})...",
-
-        # Axel
-        "axel.found_system": "Axel di sistema trovato: {path}",
-        "axel.macos_detected": "macOS rilevato - installa Axel tramite Homebrew",
-        "axel.unsupported_platform": "Piattaforma non supportata: {platform}/{arch}",
-        "axel.binary_exists": "Binary Axel già esistente: {path}",
-        "axel.downloading": "Download binary Axel da {url}...",
-        "axel.download_progress": "Progresso download: {percent}%",
-        "axel.downloaded": "Binary Axel scaricato: {path}",
-        "axel.download_failed": "Download Axel fallito: {error}",
-        "axel.version_check_failed": "Controllo versione Axel fallito: {error}",
-
-        # Scraper
-        "scraper.searching": "Ricerca: {query}",
-        "scraper.search_complete": "Trovati {count} risultati",
-        "scraper.search_failed": "Ricerca fallita: {error}",
-        "scraper.fetching_info": "Caricamento info anime da {url}",
-        "scraper.info_fetched": "Caricato '{title}' con {episodes} episodi",
-        "scraper.info_failed": "Caricamento info anime fallito: {error}",
-        "scraper.episode_parse_error": "Errore parsing episodio: {error}",
-        "scraper.extracting_video": "Estrazione URL video da {url}",
-        "scraper.video_found": "URL video trovato: {url}",
-        "scraper.video_extraction_failed": "Estrazione URL video fallita: {error}",
-        "scraper.iframe_found": "Trovato iframe: {src}",
-        "scraper.card_parse_error": "Errore parsing scheda anime: {error}",
-
-        # Download
-        "download.starting": "Avvio download: {filename}",
-        "download.completed": "Download completato: {filename}",
-        "download.failed": "Download fallito: {error}",
-        "download.retrying": "Nuovo tentativo download ({attempt}/{max_attempts})...",
-        "download.resumed": "Ripresa download: {filename}",
-        "download.disk_space_low": "Attenzione: Spazio disco basso ({available} GB disponibili)",
-        "download.disk_space_check": "Controllo spazio disco...",
-
-        # CLI
-        "cli.welcome": "AnimeWorld Downloader v{version}",
-        "cli.config_created": "Configurazione creata in: {path}",
-        "cli.no_results": "Nessun risultato per: {query}",
-        "cli.select_anime": "Seleziona un anime:",
-        "cli.select_episodes": "Seleziona episodi da scaricare:",
-        "cli.select_quality": "Seleziona qualità:",
-        "cli.select_sub_dub": "Seleziona Sub-ITA o Dub-ITA:",
-
-        # Errors
-        "error.no_video_url": "Impossibile trovare URL download video",
-        "error.invalid_episode_range": "Range episodi non valido: {range}",
-        "error.config_load_failed": "Caricamento configurazione fallito: {error}",
-
-        # General
-        "general.yes": "Sì",
-        "general.no": "No",
-        "general.cancel": "Annulla",
-        "general.continue": "Continua",
-        "general.sub_ita": "Sub-ITA",
-        "general.dub_ita": "Dub-ITA",
-    }
+    # Speed test
+    "speed_test.starting": ("Starting speed test...", "Avvio speed test..."),
+    "speed_test.ping": ("Measuring latency...", "Misurazione latenza..."),
+    "speed_test.download": ("Testing download speed...", "Test velocità download..."),
+    "speed_test.upload": ("Testing upload speed...", "Test velocità upload..."),
+    "speed_test.completed": ("Speed test completed: {download} Mbps down, {upload} Mbps up, {ping} ms ping", "Speed test completato: {download} Mbps down, {upload} Mbps up, {ping} ms ping"),
+    "speed_test.failed": ("Speed test failed: {error}", "Speed test fallito: {error}"),
+    "speed_test.attempt": ("Attempt {current}/{total}...", "Tentativo {current}/{total}..."),
+    "speed_test.retry": ("Retrying speed test (attempt {attempt})...", "Nuovo tentativo speed test ({attempt})..."),
+
+    # Axel
+    "axel.found_system": ("Found system Axel at: {path}", "Axel di sistema trovato: {path}"),
+    "axel.macos_detected": ("macOS detected - please install Axel via Homebrew", "macOS rilevato - installa Axel tramite Homebrew"),
+    "axel.unsupported_platform": ("Unsupported platform: {platform}/{arch}", "Piattaforma non supportata: {platform}/{arch}"),
+    "axel.binary_exists": ("Axel binary already exists: {path}", "Binary Axel già esistente: {path}"),
+    "axel.downloading": ("Downloading Axel binary from {url}...", "Download binary Axel da {url}..."),
+    "axel.download_progress": ("Download progress: {percent}%", "Progresso download: {percent}%"),
+    "axel.resuming": ("Resuming Axel download at byte {offset}", "Ripresa download Axel dal byte {offset}"),
+    "axel.resume_unsupported": ("Partial Axel download is stale or was not resumed (HTTP {status}), restarting", "Download parziale di Axel obsoleto o non ripreso (HTTP {status}), si ricomincia"),
+    "axel.ranges_failed": ("Parallel download failed, retrying with one connection: {error}", "Download parallelo fallito, nuovo tentativo con una connessione: {error}"),
+    "axel.downloaded": ("Axel binary downloaded: {path}", "Binary Axel scaricato: {path}"),
+    "axel.download_failed": ("Failed to download Axel: {error}", "Download Axel fallito: {error}"),
+    "axel.version_check_failed": ("Failed to check Axel version: {error}", "Controllo versione Axel fallito: {error}"),
+    "axel.output": ("Axel: {output}", "Axel: {output}"),
+
+    # Scraper
+    "scraper.searching": ("Searching for: {query}", "Ricerca: {query}"),
+    "scraper.search_complete": ("Found {count} results", "Trovati {count} risultati"),
+    "scraper.search_failed": ("Search failed: {error}", "Ricerca fallita: {error}"),
+    "scraper.fetching_info": ("Fetching anime info from {url}", "Caricamento info anime da {url}"),
+    "scraper.info_fetched": ("Loaded '{title}' with {episodes} episodes", "Caricato '{title}' con {episodes} episodi"),
+    "scraper.info_failed": ("Failed to fetch anime info: {error}", "Caricamento info anime fallito: {error}"),
+    "scraper.episode_parse_error": ("Error parsing episode: {error}", "Errore parsing episodio: {error}"),
+    "scraper.extracting_video": ("Extracting video URL from {url}", "Estrazione URL video da {url}"),
+    "scraper.video_found": ("Video URL found: {url}", "URL video trovato: {url}"),
+    "scraper.video_extraction_failed": ("Failed to extract video URL: {error}", "Estrazione URL video fallita: {error}"),
+    "scraper.iframe_found": ("Found iframe source: {src}", "Trovato iframe: {src}"),
+    "scraper.iframe_failed": ("No video found in iframe {src}: {error}", "Nessun video trovato nell'iframe {src}: {error}"),
+    "scraper.card_parse_error": ("Error parsing anime card: {error}", "Errore parsing scheda anime: {error}"),
+
+    # Download
+    "download.starting": ("Starting download: {filename}", "Avvio download: {filename}"),
+    "download.completed": ("Download completed: {filename}", "Download completato: {filename}"),
+    "download.failed": ("Download failed: {error}", "Download fallito: {error}"),
+    "download.retrying": ("Retrying download (attempt {attempt}/{max_attempts})...", "Nuovo tentativo download ({attempt}/{max_attempts})..."),
+    "download.resumed": ("Resuming download: {filename}", "Ripresa download: {filename}"),
+    "download.disk_space_low": ("Warning: Low disk space ({available} GB available)", "Attenzione: Spazio disco basso ({available} GB disponibili)"),
+    "download.disk_space_check": ("Checking disk space...", "Controllo spazio disco..."),
+    "download.disk_space_batch": ("Not enough disk space for the selected episodes (about {required} GB needed, {available} GB available)", "Spazio disco insufficiente per gli episodi selezionati (circa {required} GB necessari, {available} GB disponibili)"),
+
+    # Database
+    "database.fts_unavailable": ("Full-text search unavailable, falling back to LIKE: {error}", "Ricerca full-text non disponibile, uso di LIKE: {error}"),
+    "database.ids_migrated": ("Re-keyed stored anime and episodes with IDs from their URLs", "Anime ed episodi salvati aggiornati con gli ID presi dai loro URL"),
+
+    # CLI
+    "cli.welcome": ("AnimeWorld Downloader v{version}", "AnimeWorld Downloader v{version}"),
+    "cli.config_created": ("Configuration created at: {path}", "Configurazione creata in: {path}"),
+    "cli.no_results": ("No results found for: {query}", "Nessun risultato per: {query}"),
+    "cli.select_anime": ("Select an anime:", "Seleziona un anime:"),
+    "cli.select_episodes": ("Select episodes to download:", "Seleziona episodi da scaricare:"),
+    "cli.select_quality": ("Select quality:", "Seleziona qualità:"),
+    "cli.select_sub_dub": ("Select Sub-ITA or Dub-ITA:", "Seleziona Sub-ITA o Dub-ITA:"),
+
+    # Errors
+    "error.no_video_url": ("Could not find video download URL", "Impossibile trovare URL download video"),
+    "error.invalid_episode_range": ("Invalid episode range: {range}", "Range episodi non valido: {range}"),
+    "error.config_load_failed": ("Failed to load configuration: {error}", "Caricamento configurazione fallito: {error}"),
+
+    # General
+    "general.yes": ("Yes", "Sì"),
+    "general.no": ("No", "No"),
+    "general.cancel": ("Cancel", "Annulla"),
+    "general.continue": ("Continue", "Continua"),
+    "general.sub_ita": ("Sub-ITA", "Sub-ITA"),
+    "general.dub_ita": ("Dub-ITA", "Dub-ITA"),
 }
 
 
@@ -145,7 +99,13 @@ class I18n:
     """Internationalization helper"""
 
     def __init__(self, language: str = "en"):
-        self.language = language if language in TRANSLATIONS else "en"
+        self.language = language if language in LANG_IDX else "en"
+        self._load_table()
+
+    def _load_table(self):
+        """Cache the active language index and which entries have no placeholders"""
+        self._idx = LANG_IDX[self.language]
+        self._is_static = {key: "{" not in row[self._idx] for key, row in TRANSLATIONS.items()}
 
     def get(self, key: str, **kwargs) -> str:
         """
@@ -158,18 +118,23 @@ class I18n:
         Returns:
             str: Translated and formatted string
         """
-        text = TRANSLATIONS[self.language].get(key, key)
-        if kwargs:
-            try:
-                return text.format(**kwargs)
-            except KeyError:
-                return text
-        return text
+        row = TRANSLATIONS.get(key)
+        if row is None:
+            return key
+        text = row[self._idx]
+        if not kwargs or self._is_static[key]:
+            return text
+        try:
+            return text.format_map(_SafeDict(kwargs))
+        except (KeyError, ValueError, IndexError):
+            # E.g. a missing "{season:02d}": the "{season}" stand-in cannot take the spec
+            return text
 
     def set_language(self, language: str):
         """Set active language"""
-        if language in TRANSLATIONS:
+        if language in LANG_IDX:
             self.language = language
+            self._load_table()
 
 
 # Global instance
@@ -3,17 +3,38 @@ AnimeWorld Downloader - Interactive Menu
 Rich-based interactive menu system
 """
 
-from typing import Optional, Callable
+from typing import Optional, Callable, TYPE_CHECKING
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, IntPrompt
 from rich.table import Table
 from .i18n import get_i18n
 
+if TYPE_CHECKING:
+    from ..core.scraper import AnimeHit
+
 console = Console()
 i18n = get_i18n()
 
 
+def _build_anime_actions() -> Table:
+    """Build the actions grid shown after an anime is selected"""
+    actions = Table.grid(padding=(0, 2))
+    actions.add_column(style="cyan", justify="right")
+    actions.add_column(style="white")
+
+    actions.add_row("[1]", "List episodes")
+    actions.add_row("[2]", "Download all episodes")
+    actions.add_row("[3]", "Download specific episodes")
+    actions.add_row("[0]", "Back to main menu")
+
+    return actions
+
+
+# Static renderable, reused on every selection
+_ANIME_ACTIONS = _build_anime_actions()
+
+
 class InteractiveMenu:
     """Interactive menu for Alchemix-AWDL"""
 
@@ -35,13 +56,17 @@ class InteractiveMenu:
         self.app = app
         self.running = True
 
+        # The banner and main menu never change: build them once, not on every redraw
+        self._banner_footer = f"[dim]v{app.__class__.__module__.split('.')[-1]}[/dim]\n"
+        self._main_menu_panel = self._build_main_menu()
+
     def show_banner(self):
         """Display the application banner"""
         console.print(f"[bold cyan]{self.BANNER}[/bold cyan]")
-        console.print(f"[dim]v{self.app.__class__.__module__.split('.')[-1]}[/dim]\n")
+        console.print(self._banner_footer)
 
-    def show_main_menu(self):
-        """Display main menu"""
+    def _build_main_menu(self) -> Panel:
+        """Build the main menu panel"""
         table = Table.grid(padding=(0, 2))
         table.add_column(style="cyan", justify="right")
         table.add_column(style="white")
@@ -59,14 +84,16 @@ class InteractiveMenu:
         for key, label in menu_items:
             table.add_row(f"[{key}]", label)
 
-        panel = Panel(
+        return Panel(
             table,
             title="[bold]Alchemix-AWDL - Main Menu[/bold]",
             border_style="cyan",
             padding=(1, 2)
         )
 
-        console.print(panel)
+    def show_main_menu(self):
+        """Display main menu"""
+        console.print(self._main_menu_panel)
 
     def get_choice(self) -> str:
         """Get user menu choice"""
@@ -97,20 +124,11 @@ class InteractiveMenu:
                 selected = results[choice - 1]
                 self.handle_anime_selected(selected)
 
-    def handle_anime_selected(self, anime: dict):
+    def handle_anime_selected(self, anime: "AnimeHit"):
         """Handle anime selection from search results"""
-        console.print(f"\n[bold green]Selected:[/bold green] {anime['title']}\n")
-
-        actions = Table.grid(padding=(0, 2))
-        actions.add_column(style="cyan", justify="right")
-        actions.add_column(style="white")
-
-        actions.add_row("[1]", "List episodes")
-        actions.add_row("[2]", "Download all episodes")
-        actions.add_row("[3]", "Download specific episodes")
-        actions.add_row("[0]", "Back to main menu")
+        console.print(f"\n[bold green]Selected:[/bold green] {anime.title}\n")
 
-        console.print(actions)
+        console.print(_ANIME_ACTIONS)
 
         choice = Prompt.ask(
             "\n[bold cyan]Choose action[/bold cyan]",
@@ -119,13 +137,13 @@ class InteractiveMenu:
         )
 
         if choice == "1":
-            self.app.list_episodes(anime["url"])
+            self.app.list_episodes(anime.url)
         elif choice == "2":
-            self.handle_download(anime["url"], "all")
+            self.handle_download(anime.url, "all")
         elif choice == "3":
             episodes = Prompt.ask("[yellow]Enter episodes (e.g., 1-24 or 1,5,10)[/yellow]")
             if episodes:
-                self.handle_download(anime["url"], episodes)
+                self.handle_download(anime.url, episodes)
 
     def handle_list(self):
         """Handle episode listing"""
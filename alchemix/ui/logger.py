@@ -4,27 +4,75 @@ Rich-based logging system with i18n support
 """
 
 import sys
+import queue
+import atexit
 import logging
+import logging.handlers
+import functools
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from rich.console import Console
-from rich.logging import RichHandler
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn, DownloadColumn, TransferSpeedColumn
 from .i18n import get_i18n
 
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
 # Global console instance
 console = Console()
 
 # Global progress instance (for downloads)
-_progress: Optional[Progress] = None
+_progress: Optional["Progress"] = None
 
+# Background thread writing queued records to the log file
+_listener: Optional[logging.handlers.QueueListener] = None
 
-class I18nRichHandler(RichHandler):
-    """Rich handler with i18n support"""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.i18n = get_i18n()
+@functools.lru_cache(maxsize=None)
+def _i18n_rich_handler_class():
+    """Build the console handler class, importing rich.logging on first use"""
+    from rich.logging import RichHandler
+
+    class I18nRichHandler(RichHandler):
+        """Rich handler with i18n support"""
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.i18n = get_i18n()
+
+    return I18nRichHandler
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that writes through a large buffer instead of flushing every record"""
+
+    def __init__(self, filename, encoding: Optional[str] = None, buffer_size: int = 64 * 1024):
+        self.buffer_size = buffer_size
+        super().__init__(filename, encoding=encoding)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size, encoding=self.encoding)
+
+    def emit(self, record: logging.LogRecord):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class _LazyMessage:
+    """Log message whose i18n formatting runs only when a handler renders it"""
+
+    __slots__ = ("_format", "_key", "_kwargs")
+
+    def __init__(self, format_message, key: str, kwargs: dict):
+        self._format = format_message
+        self._key = key
+        self._kwargs = kwargs
+
+    def __str__(self) -> str:
+        return self._format(self._key, **self._kwargs)
 
 
 class Logger:
@@ -40,23 +88,28 @@ class Logger:
 
     def debug(self, key: str, **kwargs):
         """Debug level log"""
-        msg = self._format_message(key, **kwargs)
-        self.logger.debug(msg)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(self._format_message(key, **kwargs))
+
+    def debug_lazy(self, key: str, **kwargs):
+        """Debug level log, formatted only if a handler actually emits it"""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(_LazyMessage(self._format_message, key, kwargs))
 
     def info(self, key: str, **kwargs):
         """Info level log"""
-        msg = self._format_message(key, **kwargs)
-        self.logger.info(msg)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(self._format_message(key, **kwargs))
 
     def warning(self, key: str, **kwargs):
         """Warning level log"""
-        msg = self._format_message(key, **kwargs)
-        self.logger.warning(msg)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(self._format_message(key, **kwargs))
 
     def error(self, key: str, **kwargs):
         """Error level log"""
-        msg = self._format_message(key, **kwargs)
-        self.logger.error(msg)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(self._format_message(key, **kwargs))
 
     def success(self, key: str, **kwargs):
         """Success message (info level with green)"""
@@ -65,8 +118,8 @@ class Logger:
 
     def critical(self, key: str, **kwargs):
         """Critical level log"""
-        msg = self._format_message(key, **kwargs)
-        self.logger.critical(msg)
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self.logger.critical(self._format_message(key, **kwargs))
 
 
 def setup_logging(log_dir: Optional[Path] = None, verbosity: str = "normal"):
@@ -77,6 +130,8 @@ def setup_logging(log_dir: Optional[Path] = None, verbosity: str = "normal"):
         log_dir: Directory for log files
         verbosity: Verbosity level (quiet, normal, verbose, debug)
     """
+    global _listener
+
     # Map verbosity to log level
     level_map = {
         "quiet": logging.ERROR,
@@ -87,8 +142,11 @@ def setup_logging(log_dir: Optional[Path] = None, verbosity: str = "normal"):
 
     level = level_map.get(verbosity, logging.WARNING)
 
+    # Drain and close the file listener from a previous setup
+    _stop_listener()
+
     # Console handler
-    console_handler = I18nRichHandler(
+    console_handler = _i18n_rich_handler_class()(
         console=console,
         show_time=verbosity == "debug",
         show_path=verbosity == "debug",
@@ -104,31 +162,61 @@ def setup_logging(log_dir: Optional[Path] = None, verbosity: str = "normal"):
         log_dir.mkdir(parents=True, exist_ok=True)
         log_file = log_dir / "animeworld_dl.log"
 
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler = BufferedFileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)  # Always debug level for files
         file_formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
         file_handler.setFormatter(file_formatter)
-        handlers.append(file_handler)
 
-    # Configure root logger
+        # Callers only enqueue records; a listener thread does the file I/O
+        log_queue: queue.Queue = queue.Queue(-1)
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(logging.DEBUG)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        handlers.append(queue_handler)
+
+        _listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _listener.start()
+
+    # Configure root logger at the lowest level any handler accepts, so records
+    # no handler would emit are rejected before any formatting happens
     logging.basicConfig(
-        level=logging.DEBUG,
+        level=min(handler.level for handler in handlers),
         handlers=handlers,
         force=True
     )
 
 
+def _stop_listener():
+    """Flush queued records to the log file and close it"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+# Runs before logging's own shutdown hook (atexit is LIFO), so queued records are written
+atexit.register(_stop_listener)
+
+
 def get_logger(name: str) -> Logger:
     """Get logger instance"""
     return Logger(name)
 
 
-def get_progress() -> Progress:
+def get_progress() -> "Progress":
     """Get or create global progress instance"""
     global _progress
     if _progress is None:
+        # Deferred: commands that never show a progress bar skip the rich.progress import
+        from rich.progress import (
+            Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn,
+            TimeRemainingColumn, DownloadColumn, TransferSpeedColumn
+        )
+
         _progress = Progress(
             SpinnerColumn(),
             TextColumn("[bold blue]{task.description}"),
@@ -4,10 +4,11 @@ Handles downloading, managing, and executing Axel binaries
 """
 
 import os
+import re
+import logging
+import functools
 import platform
 import shutil
-import subprocess
-import requests
 from pathlib import Path
 from typing import Optional, Tuple
 from ..ui.logger import get_logger
@@ -26,6 +27,78 @@ BINARY_URLS = {
     "windows-aarch64": f"https://github.com/{AXEL_GITHUB_REPO}/releases/download/v{AXEL_VERSION}/axel-{AXEL_VERSION}-win-arm64.exe",
 }
 
+# BINARY_URLS keyed by the (platform, architecture) pair _detect_platform returns
+_URL_BY_TUPLE = {tuple(key.split("-", 1)): url for key, url in BINARY_URLS.items()}
+
+# "Axel 2.17.11 (linux-gnu)" or "Axel version 2.17.11"
+_VERSION_RE = re.compile(rb'Axel\s+(?:version\s+)?(\S+)')
+
+# Connect and read timeouts for binary downloads, in seconds
+DOWNLOAD_TIMEOUT = (10, 60)
+# Bytes read from the response per iteration while downloading a binary
+CHUNK_SIZE = 128 * 1024
+# Write buffer for the binary being downloaded
+WRITE_BUFFER_SIZE = 1024 * 1024
+# Bytes downloaded between two progress log lines
+PROGRESS_LOG_INTERVAL = 1024 * 1024
+# Parallel Range requests used for a fresh binary download
+RANGE_STREAMS = 4
+# Smaller binaries are fetched with a single request
+PARALLEL_MIN_SIZE = 1024 * 1024
+
+
+def _validator(headers) -> Optional[str]:
+    """Strong ETag or Last-Modified of a response, usable as If-Range"""
+    etag = headers.get("ETag", "")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return headers.get("Last-Modified")
+
+
+def _content_range_start(headers) -> Optional[int]:
+    """First byte of a 206 reply, from its "Content-Range: bytes start-end/size" header"""
+    unit, _, byte_range = headers.get("Content-Range", "").partition(" ")
+    start = byte_range.partition("-")[0]
+    if unit != "bytes" or not start.isdigit():
+        return None
+    return int(start)
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_platform() -> Tuple[str, str]:
+    """(platform, architecture) of this machine; it cannot change while running"""
+    system = platform.system().lower()
+    machine = platform.machine().lower()
+
+    # Normalize platform
+    if system == "linux":
+        plat = "linux"
+    elif system == "windows":
+        plat = "windows"
+    elif system == "darwin":
+        # macOS uses system Axel or can install via homebrew
+        plat = "macos"
+    else:
+        plat = "unknown"
+
+    # Normalize architecture
+    if machine in ["x86_64", "amd64"]:
+        arch = "x86_64"
+    elif machine in ["aarch64", "arm64"]:
+        arch = "aarch64"
+    elif machine in ["armv7l", "armv7"]:
+        arch = "armv7"
+    else:
+        arch = "unknown"
+
+    return plat, arch
+
+
+@functools.lru_cache(maxsize=1)
+def _which_axel() -> Optional[str]:
+    """shutil.which("axel"), kept until an AxelManager is created again"""
+    return shutil.which("axel")
+
 
 class AxelManager:
     """Manages Axel binary installation and execution"""
@@ -34,7 +107,27 @@ class AxelManager:
         self.config_dir = config_dir
         self.bin_dir = config_dir / "bin"
         self.bin_dir.mkdir(parents=True, exist_ok=True)
-        self.axel_path: Optional[Path] = None
+        self._axel_path: Optional[Path] = None
+        self._axel_str = ""
+        # A new manager looks at PATH afresh
+        _which_axel.cache_clear()
+
+        # Where a downloaded binary lives never changes for an instance
+        self._plat, self._arch = _detect_platform()
+        self._binary_name = "axel.exe" if self._plat == "windows" else "axel"
+        self._binary_path = self.bin_dir / self._binary_name
+        self._binary_url = _URL_BY_TUPLE.get((self._plat, self._arch))
+
+    @property
+    def axel_path(self) -> Optional[Path]:
+        """Path to the Axel binary in use, once ensure_axel has found one"""
+        return self._axel_path
+
+    @axel_path.setter
+    def axel_path(self, path: Optional[Path]):
+        self._axel_path = path
+        # build_command puts this first in every command line
+        self._axel_str = str(path) if path else ""
 
     def get_platform_info(self) -> Tuple[str, str]:
         """
@@ -43,31 +136,7 @@ class AxelManager:
         Returns:
             Tuple[str, str]: (platform, architecture)
         """
-        system = platform.system().lower()
-        machine = platform.machine().lower()
-
-        # Normalize platform
-        if system == "linux":
-            plat = "linux"
-        elif system == "windows":
-            plat = "windows"
-        elif system == "darwin":
-            # macOS uses system Axel or can install via homebrew
-            plat = "macos"
-        else:
-            plat = "unknown"
-
-        # Normalize architecture
-        if machine in ["x86_64", "amd64"]:
-            arch = "x86_64"
-        elif machine in ["aarch64", "arm64"]:
-            arch = "aarch64"
-        elif machine in ["armv7l", "armv7"]:
-            arch = "armv7"
-        else:
-            arch = "unknown"
-
-        return plat, arch
+        return _detect_platform()
 
     def find_system_axel(self) -> Optional[Path]:
         """
@@ -76,7 +145,7 @@ class AxelManager:
         Returns:
             Optional[Path]: Path to system Axel or None
         """
-        axel_path = shutil.which("axel")
+        axel_path = _which_axel()
         if axel_path:
             logger.info("axel.found_system", path=axel_path)
             return Path(axel_path)
@@ -89,14 +158,13 @@ class AxelManager:
         Returns:
             Optional[str]: Download URL or None if unsupported
         """
-        plat, arch = self.get_platform_info()
+        plat, arch = self._plat, self._arch
 
         if plat == "macos":
             logger.info("axel.macos_detected")
             return None  # macOS should use system or homebrew
 
-        key = f"{plat}-{arch}"
-        url = BINARY_URLS.get(key)
+        url = self._binary_url
 
         if not url:
             logger.warning("axel.unsupported_platform", platform=plat, arch=arch)
@@ -107,6 +175,11 @@ class AxelManager:
         """
         Download Axel binary from URL
 
+        A fresh download is split into RANGE_STREAMS parallel Range requests
+        when the server supports them. Otherwise a single request is made, and
+        an interrupted one is resumed on the next call, as long as the server
+        confirms (If-Range) the remote file has not changed since.
+
         Args:
             url: Download URL
             force: Force download even if exists
@@ -114,9 +187,7 @@ class AxelManager:
         Returns:
             Path: Path to downloaded binary
         """
-        plat, _ = self.get_platform_info()
-        binary_name = "axel.exe" if plat == "windows" else "axel"
-        binary_path = self.bin_dir / binary_name
+        binary_path = self._binary_path
 
         if binary_path.exists() and not force:
             logger.info("axel.binary_exists", path=str(binary_path))
@@ -124,35 +195,161 @@ class AxelManager:
 
         logger.info("axel.downloading", url=url)
 
+        # Written next to the final path and renamed into place once complete,
+        # so an interrupted download never leaves a truncated binary. The
+        # version in the name keeps a part from an older release from being
+        # resumed; the validator file records which remote file it holds.
+        part_path = binary_path.with_name(f"{binary_path.name}-{AXEL_VERSION}.part")
+        validator_path = part_path.with_name(part_path.name + ".validator")
+        for stale in self.bin_dir.glob(f"{binary_path.name}*.part*"):
+            if stale not in (part_path, validator_path):
+                stale.unlink()
+
+        # Deferred: requests is only needed when there is a binary to fetch
+        from .http import get_download_session
+        session = get_download_session()
+
         try:
-            response = requests.get(url, stream=True, timeout=60)
+            response = None
+            offset = 0
+
+            # Resume what an earlier, interrupted single-stream attempt left behind
+            if part_path.exists() and validator_path.exists():
+                offset = part_path.stat().st_size
+                validator = validator_path.read_text(encoding="utf-8").strip()
+            if offset:
+                response = session.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT, headers={
+                    "Range": f"bytes={offset}-",
+                    "If-Range": validator,
+                })
+                if response.status_code == 206 and _content_range_start(response.headers) == offset:
+                    logger.info("axel.resuming", offset=offset)
+                else:
+                    # Remote file changed (If-Range answered with the whole file),
+                    # range rejected or misplaced: the part is useless
+                    logger.debug("axel.resume_unsupported", status=response.status_code)
+                    if response.status_code != 200:
+                        response.close()
+                        response = None
+                    offset = 0
+
+            if not offset:
+                part_path.unlink(missing_ok=True)
+                validator_path.unlink(missing_ok=True)
+
+            if response is None and self._download_ranges(session, url, part_path):
+                self._install(part_path, binary_path)
+                logger.success("axel.downloaded", path=str(binary_path))
+                return binary_path
+
+            if response is None:
+                response = session.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT)
             response.raise_for_status()
 
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
+            if not offset:
+                # Recorded only when the remote file can be identified; without
+                # it a leftover part is never resumed
+                validator = _validator(response.headers)
+                if validator:
+                    validator_path.write_text(validator, encoding="utf-8")
 
-            with open(binary_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+            total_size = int(response.headers.get('content-length', 0))
+            if total_size:
+                total_size += offset
+            downloaded = offset
+            # Progress is only worth tracking when it can be shown, and then
+            # once per PROGRESS_LOG_INTERVAL rather than once per chunk
+            log_progress = bool(total_size) and logger.logger.isEnabledFor(logging.DEBUG)
+            next_log = downloaded + PROGRESS_LOG_INTERVAL
+
+            with open(part_path, 'ab' if offset else 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
                     if chunk:
                         f.write(chunk)
-                        downloaded += len(chunk)
-                        if total_size:
-                            percent = (downloaded / total_size) * 100
-                            logger.debug("axel.download_progress", percent=f"{percent:.1f}")
+                        if log_progress:
+                            downloaded += len(chunk)
+                            if downloaded >= next_log or downloaded == total_size:
+                                next_log = downloaded + PROGRESS_LOG_INTERVAL
+                                percent = (downloaded / total_size) * 100
+                                logger.debug("axel.download_progress", percent=f"{percent:.1f}")
 
-            # Make executable on Unix-like systems
-            if plat != "windows":
-                os.chmod(binary_path, 0o755)
+            self._install(part_path, binary_path)
+            validator_path.unlink(missing_ok=True)
 
             logger.success("axel.downloaded", path=str(binary_path))
             return binary_path
 
         except Exception as e:
             logger.error("axel.download_failed", error=str(e))
-            if binary_path.exists():
-                binary_path.unlink()
+            # The partial file stays for the next attempt to resume from
             raise AxelError(f"Failed to download Axel binary: {e}")
 
+    def _download_ranges(self, session, url: str, part_path: Path) -> bool:
+        """
+        Download url into part_path with RANGE_STREAMS parallel Range requests
+
+        Args:
+            session: Download session
+            url: Download URL
+            part_path: File to write
+
+        Returns:
+            bool: True when complete; False, with part_path removed, when the
+                server does not support ranges or a stream failed
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        head = session.head(url, allow_redirects=True, timeout=DOWNLOAD_TIMEOUT)
+        size = int(head.headers.get("Content-Length", 0))
+        validator = _validator(head.headers)
+        if (head.status_code != 200 or head.headers.get("Accept-Ranges") != "bytes"
+                or size < PARALLEL_MIN_SIZE or not validator):
+            return False
+
+        # Preallocate, then let every stream write its own slice
+        with open(part_path, "wb") as f:
+            f.truncate(size)
+
+        step = -(-size // RANGE_STREAMS)
+
+        def fetch(start: int):
+            end = min(start + step, size) - 1
+            headers = {"Range": f"bytes={start}-{end}", "If-Range": validator}
+            with session.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT, headers=headers) as response:
+                # Anything but the requested slice of the same file is unusable
+                if response.status_code != 206 or _content_range_start(response.headers) != start:
+                    raise AxelError(f"Range {start}-{end} not served (HTTP {response.status_code})")
+                written = 0
+                with open(part_path, "r+b", buffering=WRITE_BUFFER_SIZE) as f:
+                    f.seek(start)
+                    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                        f.write(chunk)
+                        written += len(chunk)
+            if written != end - start + 1:
+                raise AxelError(f"Range {start}-{end} incomplete: {written} bytes")
+
+        try:
+            with ThreadPoolExecutor(max_workers=RANGE_STREAMS) as pool:
+                list(pool.map(fetch, range(0, size, step)))
+        except Exception as e:
+            # A part with holes cannot be resumed: fall back to one stream
+            logger.debug("axel.ranges_failed", error=str(e))
+            part_path.unlink(missing_ok=True)
+            return False
+
+        return True
+
+    def _install(self, part_path: Path, binary_path: Path):
+        """Make a completed part executable and durable, then move it into place"""
+        with open(part_path, "rb+") as f:
+            # Make executable on Unix-like systems, through the open
+            # descriptor so the mode is durable along with the data
+            if self._plat != "windows":
+                os.fchmod(f.fileno(), 0o755)
+            os.fsync(f.fileno())
+
+        os.replace(part_path, binary_path)
+
     def ensure_axel(self, use_system: bool = True) -> Path:
         """
         Ensure Axel is available
@@ -166,6 +363,11 @@ class AxelManager:
         Raises:
             AxelError: If Axel cannot be found or installed
         """
+        # Already found by an earlier call and still there
+        axel_path = self.axel_path
+        if axel_path and axel_path.exists():
+            return axel_path
+
         # Try system Axel first if requested
         if use_system:
             system_axel = self.find_system_axel()
@@ -174,9 +376,7 @@ class AxelManager:
                 return system_axel
 
         # Check for downloaded binary
-        plat, _ = self.get_platform_info()
-        binary_name = "axel.exe" if plat == "windows" else "axel"
-        binary_path = self.bin_dir / binary_name
+        binary_path = self._binary_path
 
         if binary_path.exists():
             self.axel_path = binary_path
@@ -185,10 +385,10 @@ class AxelManager:
         # Need to download
         url = self.get_binary_url()
         if not url:
-            if plat == "macos":
+            if self._plat == "macos":
                 raise AxelError("Please install Axel via Homebrew: brew install axel")
             else:
-                raise AxelError(f"Unsupported platform: {plat}")
+                raise AxelError(f"Unsupported platform: {self._plat}")
 
         # Download binary
         binary_path = self.download_binary(url)
@@ -205,22 +405,21 @@ class AxelManager:
         if not self.axel_path:
             return None
 
+        import subprocess
+
         try:
             result = subprocess.run(
                 [str(self.axel_path), "--version"],
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
-                text=True,
                 timeout=5
             )
-            # Parse version from output
+            # Parse version from the raw output; no decoding of the rest
             output = result.stdout or result.stderr
-            if "Axel" in output:
-                # Extract version number
-                parts = output.split()
-                for i, part in enumerate(parts):
-                    if part == "version" and i + 1 < len(parts):
-                        return parts[i + 1]
-            return output.strip().split('\n')[0]
+            match = _VERSION_RE.search(output)
+            if match:
+                return match.group(1).decode("ascii", "replace")
+            return output.strip().split(b'\n')[0].decode(errors="replace")
         except Exception as e:
             logger.warning("axel.version_check_failed", error=str(e))
             return None
@@ -241,32 +440,24 @@ class AxelManager:
         if not self.axel_path:
             raise AxelError("Axel not initialized")
 
+        user_agent = kwargs.get("user_agent")
+        speed_limit = kwargs.get("speed_limit", 0)
+        max_redirect = kwargs.get("max_redirect")
+
+        # One list display; absent options contribute empty tuples
         cmd = [
-            str(self.axel_path),
+            self._axel_str,
             "-n", str(connections),
             "-o", output,
-        ]
-
-        # Add optional arguments
-        if kwargs.get("quiet", False):
-            cmd.append("-q")
-
-        if kwargs.get("verbose", False):
-            cmd.append("-v")
-
-        if "user_agent" in kwargs:
-            cmd.extend(["-U", kwargs["user_agent"]])
-
-        if "speed_limit" in kwargs and kwargs["speed_limit"] > 0:
+            *(("-q",) if kwargs.get("quiet", False) else ()),
+            *(("-v",) if kwargs.get("verbose", False) else ()),
+            *(("-U", user_agent) if user_agent is not None else ()),
             # Axel uses bytes/second for speed limit
-            limit_bytes = int(kwargs["speed_limit"] * 1024 * 1024)
-            cmd.extend(["-s", str(limit_bytes)])
-
-        if "max_redirect" in kwargs:
-            cmd.extend(["-m", str(kwargs["max_redirect"])])
-
-        # URL must be last
-        cmd.append(url)
+            *(("-s", str(int(speed_limit * 1024 * 1024))) if speed_limit and speed_limit > 0 else ()),
+            *(("-m", str(max_redirect)) if max_redirect is not None else ()),
+            # URL must be last
+            url,
+        ]
 
         return cmd
 
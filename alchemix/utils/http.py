@@ -0,0 +1,69 @@
+"""
+AnimeWorld Downloader - HTTP
+Shared requests sessions with connection pooling
+"""
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Pools kept per host, and connections kept alive in each pool
+POOL_CONNECTIONS = 8
+POOL_MAXSIZE = 16
+
+# File downloads (e.g. the Axel binary) are few, and ride out transient gateway errors
+DOWNLOAD_POOL_CONNECTIONS = 4
+DOWNLOAD_POOL_MAXSIZE = 8
+DOWNLOAD_RETRY = Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504))
+
+_session: Optional[requests.Session] = None
+_download_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _build_session(pool_connections: int, pool_maxsize: int, max_retries) -> requests.Session:
+    """Create a session whose HTTP and HTTPS requests share one pooling adapter"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=max_retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Get the process-wide HTTP session
+
+    Reusing one session keeps connections alive between requests, so repeated
+    calls to the same host skip the TCP and TLS handshakes.
+
+    Returns:
+        requests.Session: Shared session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session(POOL_CONNECTIONS, POOL_MAXSIZE, 0)
+    return _session
+
+
+def get_download_session() -> requests.Session:
+    """
+    Get the process-wide session for file downloads
+
+    Unlike get_session(), whose callers handle failures themselves, requests
+    made through it are retried on 502, 503 and 504 replies with backoff.
+
+    Returns:
+        requests.Session: Shared download session
+    """
+    global _download_session
+    if _download_session is None:
+        with _session_lock:
+            if _download_session is None:
+                _download_session = _build_session(DOWNLOAD_POOL_CONNECTIONS, DOWNLOAD_POOL_MAXSIZE, DOWNLOAD_RETRY)
+    return _download_session
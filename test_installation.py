@@ -4,8 +4,24 @@ Test script to verify AnimeWorld Downloader installation and components
 """
 
 import sys
+import importlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+
+def probe_imports(modules):
+    """Import independent third-party modules concurrently; the ImportError for each, or None, in input order"""
+    def probe(module):
+        try:
+            importlib.import_module(module)
+            return None
+        except ImportError as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        return list(pool.map(probe, modules))
+
+
 print("=" * 60)
 print("AnimeWorld Downloader - Component Test")
 print("=" * 60)
@@ -24,7 +40,6 @@ required_packages = [
     "requests",
     "bs4",
     "lxml",
-    "speedtest",
     "rich",
     "toml",
     "click",
@@ -33,16 +48,10 @@ required_packages = [
 ]
 
 missing = []
-for package in required_packages:
-    try:
-        if package == "bs4":
-            import bs4
-        elif package == "speedtest":
-            import speedtest
-        else:
-            __import__(package)
+for package, error in zip(required_packages, probe_imports(required_packages)):
+    if error is None:
         print(f"  ✓ {package}")
-    except ImportError:
+    else:
         print(f"  ✗ {package} - MISSING")
         missing.append(package)
 
@@ -53,34 +62,32 @@ if missing:
 
 # Test 3: Module imports
 print("\n[3/8] Testing module imports...")
-try:
-    from alchemix.core.config import Config
-    print("  ✓ config")
-
-    from alchemix.core.speedtest_manager import SpeedTester
-    print("  ✓ speedtest_manager")
-
-    from alchemix.core.scraper import AlchemixScraper
-    print("  ✓ scraper")
-
-    from alchemix.core.downloader import DownloadManager
-    print("  ✓ downloader")
-
-    from alchemix.core.database import Database
-    print("  ✓ database")
-
-    from alchemix.utils.axel_manager import AxelManager
-    print("  ✓ axel_manager")
-
-    from alchemix.ui.logger import get_logger
-    print("  ✓ logger")
-
-    from alchemix.ui.i18n import get_i18n
-    print("  ✓ i18n")
-
-except ImportError as e:
-    print(f"✗ Import failed: {e}")
-    sys.exit(1)
+app_modules = {
+    "config": "alchemix.core.config",
+    "speedtest_manager": "alchemix.core.speedtest_manager",
+    "scraper": "alchemix.core.scraper",
+    "downloader": "alchemix.core.downloader",
+    "database": "alchemix.core.database",
+    "axel_manager": "alchemix.utils.axel_manager",
+    "logger": "alchemix.ui.logger",
+    "i18n": "alchemix.ui.i18n",
+}
+# Serially: these modules import each other, and a concurrent import could
+# see one of them half-initialized
+for name, module in app_modules.items():
+    try:
+        importlib.import_module(module)
+    except Exception as e:
+        print(f"✗ Import failed: {e}")
+        sys.exit(1)
+    print(f"  ✓ {name}")
+
+# Already imported above; this only binds the names used by later tests
+from alchemix.core.config import Config
+from alchemix.core.database import Database
+from alchemix.core.scraper import extract_episode_id_from_url
+from alchemix.ui.logger import get_logger
+from alchemix.ui.i18n import get_i18n
 
 # Test 4: Config system
 print("\n[4/8] Testing configuration system...")
@@ -141,6 +148,17 @@ try:
     # Test adding episode
     db.add_episode("ep1", "test123", 1, title="Episode 1")
 
+    # Episodes of one anime get their own IDs, so marking one leaves the other
+    ep_ids = [
+        extract_episode_id_from_url(f"https://www.animeworld.ac/play/test-anime.test123/{episode}")
+        for episode in ("XyZ9", "Qw3r")
+    ]
+    assert ep_ids[0] != ep_ids[1]
+    for number, ep_id in enumerate(ep_ids, 1):
+        db.add_episode(ep_id, "test123", number)
+    db.mark_downloaded(ep_ids[0], "/tmp/episode1.mp4", 1)
+    assert db.filter_downloaded(ep_ids) == {ep_ids[0]}
+
     # Test stats
     stats = db.get_download_stats()
 